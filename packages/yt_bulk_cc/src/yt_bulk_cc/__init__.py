@@ -36,14 +36,6 @@ from .errors import (
 from .core import grab, video_iter, probe_video
 from .header import _fixup_loop, _single_file_header, _header_text, _prepend_header
 from .user_agent import _pick_ua
-
-try:
-    from swiftshadow.classes import ProxyInterface
-    from swiftshadow import QuickProxy as _QuickProxy
-except Exception:  # pragma: no cover - optional
-    ProxyInterface = None  # type: ignore
-    _QuickProxy = None  # type: ignore
-QuickProxy = _QuickProxy
 from .cli import main
 
 __all__ = [
@@ -93,11 +85,19 @@ os = _os
 requests = _requests
 GenericProxyConfig = GenericProxyConfig
 WebshareProxyConfig = WebshareProxyConfig
-ProxyInterface = ProxyInterface
-QuickProxy = _QuickProxy
 json = _json
 choice = _choice
 
+
+def __getattr__(name: str):
+    """Resolve the swiftshadow proxy classes from :mod:`.cli` on first access."""
+    if name in ("ProxyInterface", "QuickProxy"):
+        from . import cli
+
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ---------------------------------------------------------------------------
 # Make asyncio.run tolerant when already inside a running event loop.
 # ---------------------------------------------------------------------------
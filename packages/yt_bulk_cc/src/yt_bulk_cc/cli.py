@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import argparse
 import time
+import collections
 import concurrent.futures
-import copy
+import contextlib
 import asyncio
 import datetime
-import glob
-import json
+import functools
+import heapq
+import itertools
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import signal
 import sys
@@ -17,9 +21,10 @@ import textwrap
 from pathlib import Path
 from typing import Sequence
 
-import requests
-from rich.console import Console
-from rich.logging import RichHandler
+# The package namespace, bound while it is still initialising (it imports
+# this module).  Entry points such as ``grab`` and ``detect`` are looked up
+# on it at run time so callers and tests can swap them out.
+import yt_bulk_cc as ytb
 
 from .user_agent import _pick_ua
 from .utils import (
@@ -27,24 +32,18 @@ from .utils import (
     shorten_path as _shorten_for_windows,
     slug,
     stats as _stats,
+    stats_bytes as _stats_bytes,
+    stats_path as _stats_path,
+    json_with_stats as _json_with_stats,
+    loads_json as _loads_json,
+    splice_stats as _splice_stats,
+    STATS_PLACEHOLDER as _STATS_PLACEHOLDER,
     make_proxy as _make_proxy,
 )
 from .formatters import TimeStampedText, FMT, EXT
 from .converter import convert_existing
+from .core import _TokenBucket, _close_sessions
 from .header import _single_file_header, _fixup_loop, _header_text, _prepend_header
-from .status_display import create_status_display
-
-try:
-    from swiftshadow.classes import ProxyInterface
-    from swiftshadow import QuickProxy
-except Exception:  # pragma: no cover - optional dep
-    ProxyInterface = None  # type: ignore
-    QuickProxy = None  # type: ignore
-
-try:
-    from site_downloader.proxy import ProxyPool
-except Exception:  # pragma: no cover - optional dep
-    ProxyPool = None  # type: ignore
 from .errors import (
     CouldNotRetrieveTranscript,
     NoTranscriptFound,
@@ -55,6 +54,22 @@ from .errors import (
 )
 
 
+# Concatenated outputs are written as pre-encoded bytes through one large
+# buffer so thousands of short pieces coalesce into few write() syscalls.
+_CONCAT_BUFSIZE = 1 << 20
+
+
+def _concat_sep(vid: str, title: str) -> str:
+    """Return the divider written before each piece of a plain-text concat."""
+    return f"\n──── {vid} ── {title[:50]} ─────────────────────────\n"
+
+# ``[00001 ][VIDEO_ID] title.ext`` – the layout produced by the download loop.
+_FNAME_VID_RE = re.compile(r"(?:\d+ )?\[([^\]]+)\]")
+
+_ANSI_RE = re.compile(r"\x1B\[[0-9;]*[A-Za-z]")
+_SPLIT_RE = re.compile(r"(\d+)\s*([wWcClL])")
+
+
 class C:
     """ANSI colour codes."""
 
@@ -77,28 +92,77 @@ class ColorFormatter(logging.Formatter):
     }
 
     def format(self, record):  # type: ignore[override]
-        rec = copy.copy(record)
-        color = self.COLORS.get(rec.levelno, C.END)
-        rec.levelname = f"{color}{rec.levelname}{C.END}"
-        if rec.levelno >= logging.WARNING:
-            rec.msg = f"{color}{rec.getMessage()}{C.END}"
-            rec.args = ()
-        if rec.msg.startswith("Summary:") and len(rec.args) == 6:
-            ok, none, fail, proxy_fail, banned, total = rec.args
-            rec.msg = (
-                f"Summary: ✓ {C.GRN}{ok}{C.END}   •  "
-                f"↯ no-caption {C.YEL}{none}{C.END}   •  "
-                f"⚠ failed {C.RED}{fail}{C.END}   "
-                f"🌐 proxy-failed {C.RED}{proxy_fail}{C.END}   "
-                f"🚫 banned {C.RED}{banned}{C.END}   "
-                f"(total {total})"
-            )
-            rec.args = ()
-        return super().format(rec)
+        # Colourise in place and put the fields back afterwards, so other
+        # handlers see the original record without a copy per emission.
+        orig_levelname, orig_msg, orig_args = record.levelname, record.msg, record.args
+        try:
+            color = self.COLORS.get(record.levelno, C.END)
+            record.levelname = f"{color}{record.levelname}{C.END}"
+            if record.levelno >= logging.WARNING:
+                record.msg = f"{color}{record.getMessage()}{C.END}"
+                record.args = ()
+            if record.msg.startswith("Summary:") and len(record.args) == 6:
+                ok, none, fail, proxy_fail, banned, total = record.args
+                record.msg = (
+                    f"Summary: ✓ {C.GRN}{ok}{C.END}   •  "
+                    f"↯ no-caption {C.YEL}{none}{C.END}   •  "
+                    f"⚠ failed {C.RED}{fail}{C.END}   "
+                    f"🌐 proxy-failed {C.RED}{proxy_fail}{C.END}   "
+                    f"🚫 banned {C.RED}{banned}{C.END}   "
+                    f"(total {total})"
+                )
+                record.args = ()
+            return super().format(record)
+        finally:
+            record.levelname, record.msg, record.args = orig_levelname, orig_msg, orig_args
+
+
+def _disable_colours() -> None:
+    """Blank every ANSI code in :class:`C` and :class:`ColorFormatter`."""
+    for name in ("GRN", "BLU", "RED", "YEL", "END"):
+        setattr(C, name, "")
+    ColorFormatter.COLORS = dict.fromkeys(ColorFormatter.COLORS, "")
+
+
+# Rich, swiftshadow and site_downloader dominate import time, so they are only
+# loaded once a run actually needs them (``--formats-help`` needs none).
+_PROXY_BACKENDS = ("ProxyInterface", "QuickProxy", "ProxyPool")
+
+
+def _load_proxy_backends() -> None:
+    """Bind the optional proxy classes as module globals (``None`` if missing).
+
+    Names that are already bound (e.g. monkeypatched) are left alone.
+    """
+    g = globals()
+    if all(name in g for name in _PROXY_BACKENDS):
+        return
+    try:
+        from swiftshadow.classes import ProxyInterface
+        from swiftshadow import QuickProxy
+    except Exception:  # pragma: no cover - optional dep
+        ProxyInterface = None  # type: ignore
+        QuickProxy = None  # type: ignore
+    try:
+        from site_downloader.proxy import ProxyPool
+    except Exception:  # pragma: no cover - optional dep
+        ProxyPool = None  # type: ignore
+    g.setdefault("ProxyInterface", ProxyInterface)
+    g.setdefault("QuickProxy", QuickProxy)
+    g.setdefault("ProxyPool", ProxyPool)
+
+
+def __getattr__(name: str):
+    """Import the swiftshadow proxy classes on first access (slow import)."""
+    if name in _PROXY_BACKENDS:
+        _load_proxy_backends()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def initialize_proxy_pool(args, status_display):
     """Initialize proxy pool with proper timeout and error handling."""
+    _load_proxy_backends()
     status_display.update_status("🌐 Loading public proxies...")
     
     try:
@@ -118,15 +182,13 @@ async def initialize_proxy_pool(args, status_display):
         # Use a more aggressive timeout and proper error handling
         try:
             # Try to get at least one proxy to verify the pool is working
-            await asyncio.wait_for(
-                _wait_for_proxy_availability(proxy_pool, args.public_proxy), 
-                timeout=30.0
-            )
+            async with asyncio.timeout(30.0):
+                await _wait_for_proxy_availability(proxy_pool, args.public_proxy)
             
             # Update status display with actual proxy info
             proxy_count = getattr(proxy_pool, '_proxy_count', args.public_proxy)
             if hasattr(proxy_pool, '_proxies') and proxy_pool._proxies:
-                proxy_list = list(proxy_pool._proxies)[:10]  # Limit display
+                proxy_list = list(itertools.islice(proxy_pool._proxies, 10))  # Limit display
                 status_display.update_proxies(proxy_list)
                 status_display.update_proxy_pool_total(len(proxy_list))
                 status_display.update_active_proxy_count(0)  # No active downloads yet
@@ -156,61 +218,122 @@ async def initialize_proxy_pool(args, status_display):
         return None
 
 
+def _start_log_listener(
+    *handlers: logging.Handler,
+) -> tuple[logging.handlers.QueueHandler, logging.handlers.QueueListener]:
+    """Return a queue handler whose records *handlers* emit on a worker thread.
+
+    The queue is a :class:`queue.Queue`, on which the listener calls
+    ``task_done()`` per record, so ``listener.queue.join()`` waits until
+    everything enqueued so far has been emitted.
+    """
+    log_q: queue.Queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_q, *handlers, respect_handler_level=True)
+    listener.start()
+    return logging.handlers.QueueHandler(log_q), listener
+
+
+def _load_cookies(path: str) -> list:
+    """Return the cookie list stored in the JSON file at *path*."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    return _loads_json(data)
+
+
+def _measure_file(path: Path) -> tuple[int, int, int] | None:
+    """Return ``(words, lines, chars)`` for *path*, or ``None`` if unreadable."""
+    try:
+        return _stats_path(path)
+    except Exception:
+        return None
+
+
+def _index_by_video_id(folder: Path, ext: str) -> dict[str, Path]:
+    """Map video IDs to their ``*.ext`` transcript in *folder* with one scan."""
+    suffix = f".{ext}"
+    index: dict[str, Path] = {}
+    with os.scandir(folder) as it:
+        for entry in it:
+            if not entry.name.endswith(suffix):
+                continue
+            m = _FNAME_VID_RE.match(entry.name)
+            if m:
+                index.setdefault(m.group(1), Path(entry.path))
+    return index
+
+
+def _read_ahead(items, read, window: int = 8):
+    """Yield ``(item, future)`` in order, reading ``item[-1]`` in threads.
+
+    Up to *window* reads run ahead of the consumer, so slow filesystems
+    overlap I/O while memory stays bounded to a few files.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=window) as ex:
+        pending: collections.deque = collections.deque()
+        for item in items:
+            pending.append((item, ex.submit(read, item[-1])))
+            if len(pending) > window:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+def _has_proxy(proxy_pool) -> bool:
+    """Return ``True`` if *proxy_pool* can hand out a proxy right now."""
+    get = getattr(proxy_pool, "get", None)
+    if get is not None and get():
+        return True
+    return bool(getattr(proxy_pool, "_proxies", None))
+
+
 async def _wait_for_proxy_availability(proxy_pool, max_proxies):
     """Wait for at least one proxy to become available."""
     max_attempts = 10
+    delay = 0.1
+    # ProxyPool populates itself in a background task when created inside the
+    # loop; wake as soon as that lands rather than on a fixed polling tick.
+    init_task = getattr(proxy_pool, "_init_task", None)
+    if not isinstance(init_task, asyncio.Future):
+        init_task = None
     for attempt in range(max_attempts):
         try:
-            # Try to get a proxy to verify the pool is working
-            if hasattr(proxy_pool, 'get'):
-                test_proxy = proxy_pool.get()
-                if test_proxy:
-                    logging.debug("✅ Proxy pool validation successful")
-                    return
-            
-            # If no direct get method, check internal state
-            if hasattr(proxy_pool, '_proxies') and proxy_pool._proxies:
-                logging.debug("✅ Proxy pool has proxies available")
+            if init_task is not None and not init_task.done():
+                await asyncio.wait({init_task}, timeout=delay)
+            elif _has_proxy(proxy_pool):
+                logging.debug("✅ Proxy pool validation successful")
                 return
-                
-            # Wait a bit before retrying
-            await asyncio.sleep(1.0)
-            
+            else:
+                await asyncio.sleep(delay)
         except Exception as e:
             logging.debug("Proxy availability check attempt %d failed: %s", attempt + 1, e)
             if attempt < max_attempts - 1:
-                await asyncio.sleep(2.0)
+                await asyncio.sleep(delay)
             else:
                 raise
+        delay = min(delay * 2, 2.0)
 
 
-async def _main() -> None:
-    # Suppress urllib3 connection cleanup errors during shutdown
-    import warnings
-    warnings.filterwarnings("ignore", message=".*Bad file descriptor.*", category=ResourceWarning)
-    warnings.filterwarnings("ignore", message=".*unclosed.*", category=ResourceWarning)
-    warnings.filterwarnings("ignore", message=".*ClientProxyConnectionError.*", category=RuntimeWarning)
-    
-    # Also suppress SwiftShadow cleanup errors
-    import logging
-    logging.getLogger("swiftshadow").addFilter(lambda record: "Bad file descriptor" not in record.getMessage())
-    class _ManFmt(
-        argparse.ArgumentDefaultsHelpFormatter, argparse.RawTextHelpFormatter
-    ):
-        def __init__(self, prog):
-            super().__init__(prog, max_help_position=32)
-
-        def _format_action_invocation(self, action):
-            if not action.option_strings:
-                return super()._format_action_invocation(action)
-            parts = [", ".join(action.option_strings)]
-            if action.nargs != 0:
-                metavar = self._format_args(
-                    action, self._get_default_metavar_for_optional(action)
-                )
-                parts.append(metavar)
-            return " ".join(parts)
+class _ManFmt(
+    argparse.ArgumentDefaultsHelpFormatter, argparse.RawTextHelpFormatter
+):
+    def __init__(self, prog):
+        super().__init__(prog, max_help_position=32)
+
+    def _format_action_invocation(self, action):
+        if not action.option_strings:
+            return super()._format_action_invocation(action)
+        parts = [", ".join(action.option_strings)]
+        if action.nargs != 0:
+            metavar = self._format_args(
+                action, self._get_default_metavar_for_optional(action)
+            )
+            parts.append(metavar)
+        return " ".join(parts)
 
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Return the command-line parser (built once per process)."""
     P = argparse.ArgumentParser(
         prog="yt_bulk_cc.py",
         description="Bulk-download YouTube captions / transcripts (no API key).",
@@ -249,7 +372,7 @@ async def _main() -> None:
         "--sleep",
         type=float,
         default=2.0,
-        help="Seconds to wait between requests and after each download",
+        help="Seconds between playlist requests; transcript requests are paced to one per job every N seconds",
     )
     P.add_argument(
         "-v", "--verbose", action="count", default=0, help="-v=info, -vv=debug"
@@ -323,6 +446,11 @@ async def _main() -> None:
         metavar="FILE",
         help="Convert an existing JSON file to another format and exit",
     )
+    P.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Re-download (or with --convert re-convert) files even if they already exist",
+    )
     P.add_argument("--cookie-json", help="Load cookies from a Netscape or JSON file")
     P.add_argument(
         "--basename", default="captions", help="Base filename for concatenated output"
@@ -348,7 +476,20 @@ async def _main() -> None:
     P.add_argument("--summary-max-no-captions", type=int, default=20, help="Maximum number of no-caption videos to display in summary")
     P.add_argument("--summary-max-failed", type=int, default=20, help="Maximum number of failed videos to display in summary")
     P.add_argument("--summary-max-proxies", type=int, default=10, help="Maximum number of proxies to display in summary")
+    return P
+
 
+async def _run(stack: contextlib.ExitStack) -> None:
+    # Suppress urllib3 connection cleanup errors during shutdown
+    import warnings
+    warnings.filterwarnings("ignore", message=".*Bad file descriptor.*", category=ResourceWarning)
+    warnings.filterwarnings("ignore", message=".*unclosed.*", category=ResourceWarning)
+    warnings.filterwarnings("ignore", message=".*ClientProxyConnectionError.*", category=RuntimeWarning)
+    
+    # Also suppress SwiftShadow cleanup errors
+    import logging
+    logging.getLogger("swiftshadow").addFilter(lambda record: "Bad file descriptor" not in record.getMessage())
+    P = _build_parser()
     args = P.parse_args()
     if args.formats_help:
         print(
@@ -400,13 +541,23 @@ async def _main() -> None:
         )
         sys.exit(0)
 
+    from rich.console import Console
+    from rich.logging import RichHandler
+    from .status_display import create_status_display
+
     if args.convert:
         out_dir = Path(args.folder).expanduser()
         out_dir.mkdir(parents=True, exist_ok=True)
         status_display = create_status_display(Console(file=sys.__stdout__, force_terminal=True))
         status_display.start()
         status_display.update_status("Converting transcripts...")
-        convert_existing(args.convert, args.format, out_dir, include_stats=args.stats)
+        convert_existing(
+            args.convert,
+            args.format,
+            out_dir,
+            include_stats=args.stats,
+            overwrite=args.overwrite,
+        )
         status_display.update_status("Finished")
         status_display.stop()
         print(f"\U0001F4C1 Output Directory: {out_dir.resolve()}")
@@ -418,7 +569,7 @@ async def _main() -> None:
     split_limit: int | None = None
     split_unit: str | None = None
     if args.split:
-        m = re.fullmatch(r"(\d+)\s*([wWcClL])", args.split.strip())
+        m = _SPLIT_RE.fullmatch(args.split.strip())
         if not m:
             P.error("--split must be like 10000c / 8000w / 2500l")
         split_limit = int(m.group(1))
@@ -426,6 +577,14 @@ async def _main() -> None:
     if args.split and not args.concat:
         P.error("--split only makes sense together with --concat")
 
+    # Parse the cookie jar in a worker thread so it overlaps with playlist
+    # paging and status-display setup instead of blocking the event loop.
+    cookies_task = (
+        asyncio.create_task(asyncio.to_thread(_load_cookies, args.cookie_json))
+        if args.cookie_json
+        else None
+    )
+
     log_file: Path | None = None
     if not args.no_log:
         if args.log_file:
@@ -434,43 +593,78 @@ async def _main() -> None:
             ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
             log_file = Path(args.folder).expanduser() / f"yt_bulk_cc_{ts}.log"
     if log_file:
-        import atexit
-
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        _ANSI_RE = re.compile(r"\x1B\[[0-9;]*[A-Za-z]")
 
         # Only redirect stderr to capture error output, not stdout
-        fh = log_file.open("w", encoding="utf-8")
+        fh = stack.enter_context(log_file.open("w", encoding="utf-8"))
         _orig_err = sys.stderr
         
         class _StderrTee:
+            # The log copy is buffered and cleaned once per drain rather than
+            # running the ANSI regex on every write; this also catches escape
+            # sequences split across writes.  Logging flushes after every
+            # record, so the file side only drains once 64 KiB are pending or
+            # half a second has passed; sync() forces it.
+            _MAX_PENDING = 1 << 16
+            _MAX_DELAY = 0.5
+
             def __init__(self, console_stream, file_stream):
                 self._console = console_stream
                 self._file = file_stream
+                self._pending: list[str] = []
+                self._pending_len = 0
+                self._last_drain = time.monotonic()
 
             def write(self, data):
-                cleaned = data.replace("\r", "")
                 self._console.write(data)
-                self._file.write(_ANSI_RE.sub("", cleaned))
+                self._pending.append(data)
+                self._pending_len += len(data)
+                if self._pending_len >= self._MAX_PENDING:
+                    self._drain()
+
+            def _drain(self):
+                self._last_drain = time.monotonic()
+                if not self._pending:
+                    return
+                text = "".join(self._pending)
+                self._pending.clear()
+                self._pending_len = 0
+                # Plain log lines carry neither; a C-level scan is far
+                # cheaper than running the replacement and the regex.
+                if "\r" in text:
+                    text = text.replace("\r", "")
+                if "\x1b" in text:
+                    text = _ANSI_RE.sub("", text)
+                self._file.write(text)
+                self._file.flush()
 
             def flush(self):
                 self._console.flush()
-                self._file.flush()
+                if time.monotonic() - self._last_drain >= self._MAX_DELAY:
+                    self._drain()
 
-        sys.stderr = _StderrTee(_orig_err, fh)
+            def sync(self):
+                self._console.flush()
+                self._drain()
+
+        tee = _StderrTee(_orig_err, fh)
+        sys.stderr = tee
 
+        @stack.callback
         def _restore_streams():
             sys.stderr = _orig_err
-            fh.close()
-
-        atexit.register(_restore_streams)
+            tee.sync()
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         LOG_FMT_FILE = "%(asctime)s - %(levelname)s - %(message)s"
         DATE_FMT = "%Y-%m-%d %H:%M:%S"
         file_handler.setFormatter(logging.Formatter(LOG_FMT_FILE, DATE_FMT))
+        # Registered before the log listeners are, so this runs after them.
+        stack.callback(file_handler.close)
     else:
         file_handler = None
     console_level = [logging.WARNING, logging.INFO, logging.DEBUG][min(args.verbose, 2)]
+    # Plain status lines on stdout are shown from -v upwards.
+    show_progress = console_level <= logging.INFO
     # For console output, only show CRITICAL when verbose=0, otherwise use normal levels
     console_display_level = logging.CRITICAL if args.verbose == 0 else console_level
     term_console = Console(file=sys.__stdout__, force_terminal=True)
@@ -485,81 +679,102 @@ async def _main() -> None:
     if file_handler:
         file_handler.setLevel(logging.DEBUG)
     root_logger_level = logging.DEBUG if file_handler else console_level
-    logging.basicConfig(
-        level=root_logger_level,
-        handlers=[console_handler] + ([file_handler] if file_handler else []),
+    # Loggers only enqueue records; formatting, ANSI rendering and file I/O
+    # happen on listener threads so they never stall the event loop.
+    listeners: list[logging.handlers.QueueListener] = []
+
+    def _drain_logs() -> None:
+        """Block until every record queued so far has been emitted."""
+        for listener in listeners:
+            listener.queue.join()
+
+    def _stop_logs() -> None:
+        while listeners:
+            listeners.pop().stop()
+
+    root_queue_handler, root_listener = _start_log_listener(
+        console_handler, *([file_handler] if file_handler else [])
     )
+    listeners.append(root_listener)
+    stack.callback(_stop_logs)
+    # Pooled HTTP sessions (and their keep-alive sockets) end with the run.
+    stack.callback(_close_sessions)
+    # basicConfig used to give the console handler its default format; keep
+    # that, and have the queue handler pass plain messages through.
+    console_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    root_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=root_logger_level, handlers=[root_queue_handler])
     
     # ── External library logging integration ─────────────────────────────────────
     # Configure external library loggers to respect verbosity levels
     # When verbose=0, only show ERROR+ messages in console; when verbose>=1, show all
     external_console_level = console_display_level
     
+    # One console handler, listener and queue serve every external logger,
+    # plus the file handler if available (always capture all levels to file)
+    ext_console_handler = RichHandler(
+        console=term_console,
+        show_time=False,
+        show_level=True,
+        show_path=False,
+        markup=False,
+    )
+    ext_console_handler.setLevel(external_console_level)
+    ext_queue_handler, ext_listener = _start_log_listener(
+        *([file_handler] if file_handler else []), ext_console_handler
+    )
+    listeners.append(ext_listener)
     for logger_name in ["swiftshadow", "site_downloader"]:
         ext_logger = logging.getLogger(logger_name)
         ext_logger.setLevel(logging.DEBUG if args.verbose > 1 else logging.INFO)
         ext_logger.propagate = True
         ext_logger.handlers.clear()
-        
-        # Add file handler if available (always capture all levels to file)
-        if file_handler:
-            ext_logger.addHandler(file_handler)
-        
-        # Add console handler with appropriate level for external libraries
-        ext_console_handler = RichHandler(
-            console=term_console,
-            show_time=False,
-            show_level=True,
-            show_path=False,
-            markup=False,
-        )
-        ext_console_handler.setLevel(external_console_level)
-        ext_logger.addHandler(ext_console_handler)
+        ext_logger.addHandler(ext_queue_handler)
     if args.timestamps:
         FMT["text"] = TimeStampedText(show=True)
         FMT["pretty"] = TimeStampedText(show=True)
-    from importlib import import_module
-
-    ytb = import_module("yt_bulk_cc")
     kind, ident = ytb.detect(args.LINK)
     out_dir = Path(args.folder).expanduser()
     out_dir.mkdir(parents=True, exist_ok=True)
-    videos = list(ytb.video_iter(kind, ident, args.limit, args.sleep))
-    if args.limit:
-        videos = videos[: args.limit]
-    if not videos:
+    # The listing is consumed lazily: only the first entry is pulled here,
+    # the rest are read by the download producer as it queues work, and
+    # just the (id, title) pair of each is kept for the concat stage.
+    video_stream = itertools.islice(
+        ytb.video_iter(kind, ident, args.limit, args.sleep), args.limit or None
+    )
+    first_video = next(video_stream, None)
+    if first_video is None:
         logging.error("No videos found - is the link correct?")
         sys.exit(1)
-    logging.info("Found %s videos", len(videos))
+    videos: list[tuple[str, str]] = []
     # Create dynamic status display
     status_display = create_status_display(term_console)
     status_display.start()
     status_display.update_status("Preparing...")
-    status_display.set_total_videos(len(videos))
     status_display.update_jobs(args.jobs)
     proxy_pool = None
     proxy_cfg = None  # ensure defined for downstream references
     
     # Process custom proxy flags (--proxy and --proxy-file)
     proxies: list[str] = []
-    cli_proxies: list[str] = []
-    file_proxies: list[str] = []
-    
+
     if args.proxy:
         status_display.update_status("Reading CLI proxies...")
-        cli_proxies = [p.strip() for p in args.proxy.split(",") if p.strip()]
-        proxies.extend(cli_proxies)
-        logging.info("Loaded %d proxies from CLI", len(cli_proxies))
-        status_display.update_status(f"Loaded {len(cli_proxies)} CLI proxies")
+        proxies.extend(filter(None, map(str.strip, args.proxy.split(","))))
+        cli_count = len(proxies)
+        logging.info("Loaded %d proxies from CLI", cli_count)
+        status_display.update_status(f"Loaded {cli_count} CLI proxies")
     
     if args.proxy_file:
         status_display.update_status("Reading proxy file...")
         try:
-            with open(args.proxy_file, "r", encoding="utf-8") as fh:
-                file_proxies = [p.strip() for p in fh if p.strip()]
-                proxies.extend(file_proxies)
-                logging.info("Loaded %d proxies from file %s", len(file_proxies), args.proxy_file)
-            status_display.update_status(f"Loaded {len(file_proxies)} proxies from file")
+            # Stream straight into ``proxies``; no intermediate list per file.
+            before = len(proxies)
+            with open(args.proxy_file, "r", encoding="utf-8", buffering=1 << 20) as fh:
+                proxies.extend(filter(None, map(str.strip, fh)))
+            file_count = len(proxies) - before
+            logging.info("Loaded %d proxies from file %s", file_count, args.proxy_file)
+            status_display.update_status(f"Loaded {file_count} proxies from file")
         except Exception as e:
             logging.error("Cannot read proxy file %s (%s)", args.proxy_file, e)
             status_display.update_status("Proxy file error")
@@ -584,18 +799,19 @@ async def _main() -> None:
             status_display.update_status(f"Proxy pool ready - {len(proxies)} proxies")
 
     # Initialize public proxy pool with proper timeout and error handling
+    if args.public_proxy:
+        _load_proxy_backends()
     if args.public_proxy and ProxyPool:
         proxy_pool = await initialize_proxy_pool(args, status_display)
     elif args.public_proxy and not ProxyPool:
         logging.error("🚫 SwiftShadow not available; --public-proxy ignored.")
-        if console_level <= logging.INFO:
+        if show_progress:
             print(f"{C.RED}❌ Status: SwiftShadow unavailable{C.END}")
         proxy_pool = None
     cookies_data: list | None = None
-    if args.cookie_json:
+    if cookies_task:
         try:
-            with open(args.cookie_json, "rb") as fh:
-                cookies_data = json.load(fh)
+            cookies_data = await cookies_task
         except Exception as e:
             logging.error("Cannot read cookies file %s (%s)", args.cookie_json, e)
             sys.exit(1)
@@ -604,8 +820,11 @@ async def _main() -> None:
     proxies_used: set[str] = set()
 
     if args.check_ip:
-        first_vid = videos[0]["videoId"]
-        ok_probe, banned_proxies = ytb.probe_video(
+        first_vid = first_video["videoId"]
+        # The probe makes blocking HTTP calls; keep the loop (and the status
+        # display) running while it does.
+        ok_probe, banned_proxies = await asyncio.to_thread(
+            ytb.probe_video,
             first_vid,
             cookies=cookies_data,
             proxy_pool=proxy_pool,
@@ -624,147 +843,228 @@ async def _main() -> None:
             )
     sem = asyncio.Semaphore(args.jobs)
     skipped: list[tuple[str, str, str]] = []
-    tasks = []
-    for idx, video in enumerate(videos, 1):
-        vid = video["videoId"]
-        title_runs = video.get("title", {}).get("runs", [])
-        title = title_runs[0]["text"] if title_runs else vid
-        seq = f"{idx:05d} " if not args.no_seq_prefix else ""
-        fname = f"{seq}[{vid}] {slug(title)}.{EXT[args.format]}"
-        path = _shorten_for_windows(Path(args.folder).expanduser() / fname)
-        if path.exists() and not args.concat:
-            logging.info("✿ %s already exists", path.name)
-            skipped.append(("ok", vid, title))
-            continue
-        tasks.append(
-            ytb.grab(
-                vid,
-                title,
-                path,
-                args.language,
-                args.format,
-                sem,
-                tries=6,
-                cookies=cookies_data,
-                proxy_pool=proxy_pool,
-                proxy_cfg=proxy_cfg,
-                banned=banned_proxies,
-                used=proxies_used,
-                include_stats=args.stats and not args.concat,
-                delay=args.sleep,
-                status_display=status_display,
-            )
-        )
+    # One directory listing instead of a stat() per candidate file.
+    existing = set() if args.concat or args.overwrite else set(os.listdir(out_dir))
+    ext = EXT[args.format]
+    seq_prefix = not args.no_seq_prefix
+    queued = 0
+
+    def _plan():
+        """Yield ``(id, title, path)`` for each listed video.
+
+        *path* is ``None`` for videos already on disk.  This runs in worker
+        threads, so it only reads shared state; the bookkeeping is left to
+        the caller on the event loop.
+        """
+        for idx, video in enumerate(itertools.chain([first_video], video_stream), 1):
+            vid = video["videoId"]
+            title_runs = video.get("title", {}).get("runs", [])
+            title = title_runs[0]["text"] if title_runs else vid
+            if seq_prefix:
+                fname = f"{idx:05d} [{vid}] {slug(title)}.{ext}"
+            else:
+                fname = f"[{vid}] {slug(title)}.{ext}"
+            path = _shorten_for_windows(out_dir / fname)
+            if not args.concat and path.name in existing:
+                logging.info("✿ %s already exists", path.name)
+                yield vid, title, None
+            else:
+                yield vid, title, path
+
     status_display.update_status("Downloading transcripts...")
-    status_display.update_downloads(0, len(tasks))
-    
-    if console_level <= logging.INFO:
-        concurrent_info = f"Concurrent Jobs: {args.jobs}"
-        if proxy_pool and hasattr(proxy_pool, '_proxies'):
-            proxy_count = len(getattr(proxy_pool, '_proxies', []))
-            proxy_info = f" | 🌐 Proxies: {proxy_count} loaded"
+    # Pool size is measured once; the per-completion update only subtracts
+    # the banned count from it.
+    has_pool_list = bool(proxy_pool) and hasattr(proxy_pool, "_proxies")
+    if has_pool_list:
+        pool_size: int | None = len(proxy_pool._proxies or ())
+    elif proxies:
+        pool_size = len(proxies)
+    else:
+        pool_size = None
+
+    if show_progress:
+        if has_pool_list:
+            proxy_info = f" | 🌐 Proxies: {pool_size} loaded"
         elif proxy_pool:
             proxy_info = " | 🌐 Proxies: Active"
         else:
             proxy_info = ""
-            
-        print(f"{C.BLU}⬇️ Status: Downloading transcripts... | {concurrent_info}{proxy_info}{C.END}")
-    if not tasks and not skipped and not pre_results:
-        logging.info("Nothing to do (all files already present).")
-        status_display.update_status("Finished")
-        status_display.stop()
-        return
+        print(
+            f"{C.BLU}⬇️ Status: Downloading transcripts... | "
+            f"Concurrent Jobs: {args.jobs}{proxy_info}{C.END}"
+        )
     orig_console_level = console_handler.level
+    _drain_logs()  # earlier records still use the pre-download console level
     console_handler.setLevel(logging.ERROR)
     try:
-        results = []
+        # Results are bucketed by outcome as they arrive; the counters shown
+        # in the status display are just the bucket sizes.
+        buckets: dict[str, list[tuple[str, str, str]]] = {
+            "ok": [],
+            "none": [],
+            "fail": [],
+            "proxy_fail": [],
+        }
         completed_count = 0
-        no_caption_count = 0
-        fail_count = 0
-        proxy_fail_count = 0
         status_display.update_counts(0, 0, 0, 0)
-        successful_count = 0
-        for fut in asyncio.as_completed(tasks):
-            res = await fut
-            results.append(res)
+
+        def _record(res: tuple[str, str, str]) -> None:
+            nonlocal completed_count
+            buckets.setdefault(res[0], []).append(res)
             completed_count += 1
-            code = res[0]
-            if code == "ok":
-                successful_count += 1
-            elif code == "none":
-                no_caption_count += 1
-            elif code == "fail":
-                fail_count += 1
-            elif code == "proxy_fail":
-                proxy_fail_count += 1
             status_display.update_downloads(completed_count)
-            status_display.update_successful_downloads(successful_count)
+            status_display.update_successful_downloads(len(buckets["ok"]))
             status_display.update_counts(
-                no_caption_count,
-                fail_count,
-                proxy_fail_count,
+                len(buckets["none"]),
+                len(buckets["fail"]),
+                len(buckets["proxy_fail"]),
                 len(banned_proxies),
             )
             
-            # Update proxy counts
-            try:
-                # Update active proxy count by subtracting banned proxies
-                if proxy_pool and hasattr(proxy_pool, '_proxies'):
-                    total_proxies = len(getattr(proxy_pool, '_proxies', []))
-                    active_count = max(0, total_proxies - len(banned_proxies))
-                    status_display.update_active_proxy_count(active_count)
-                elif proxies:  # Custom proxy list
-                    active_count = max(0, len(proxies) - len(banned_proxies))
-                    status_display.update_active_proxy_count(active_count)
-                
-                # Update proxies used count
-                status_display.update_proxies_used_count(len(proxies_used))
-            except Exception as e:
-                logging.debug("Error updating proxy counts: %s", e)
+            # Active proxies are the measured pool minus the banned ones; this
+            # is plain arithmetic on sizes, so there is nothing here to guard.
+            if pool_size is not None:
+                status_display.update_active_proxy_count(
+                    max(0, pool_size - len(banned_proxies))
+                )
+            status_display.update_proxies_used_count(len(proxies_used))
+
+        # A fixed set of workers drains a bounded queue, so only O(jobs)
+        # grab() coroutines exist at any time however long the playlist is.
+        work_q: asyncio.Queue[tuple[str, str, Path] | None] = asyncio.Queue(
+            maxsize=args.jobs * 2
+        )
+        n_workers = args.jobs
+        # --sleep paces requests through one shared bucket: every worker
+        # still gets one request per --sleep seconds on average, but they
+        # are spread evenly instead of all workers waking together.
+        pacer = (
+            _TokenBucket(args.jobs / args.sleep, args.jobs) if args.sleep > 0 else None
+        )
+
+        async def _produce() -> None:
+            # Listing is blocking (scrapetube fetches pages and sleeps), so
+            # each step runs in a thread and downloads start as soon as the
+            # first videos are queued instead of after the whole crawl.
+            nonlocal queued
+            plan = _plan()
+            while (item := await asyncio.to_thread(next, plan, None)) is not None:
+                vid, title, path = item
+                videos.append((vid, title))
+                if path is None:
+                    skipped.append(("ok", vid, title))
+                    continue
+                queued += 1
+                # The total grows with the listing rather than appearing
+                # only once the crawl is done.
+                status_display.update_downloads(completed_count, queued)
+                await work_q.put(item)
+            logging.info("Found %s videos", len(videos))
+            status_display.set_total_videos(len(videos))
+            status_display.update_downloads(completed_count, queued)
+            for _ in range(n_workers):
+                await work_q.put(None)
+
+        async def _worker() -> None:
+            grab = ytb.grab
+            while (item := await work_q.get()) is not None:
+                vid, title, path = item
+                _record(
+                    await grab(
+                        vid,
+                        title,
+                        path,
+                        args.language,
+                        args.format,
+                        sem,
+                        tries=6,
+                        cookies=cookies_data,
+                        proxy_pool=proxy_pool,
+                        proxy_cfg=proxy_cfg,
+                        banned=banned_proxies,
+                        used=proxies_used,
+                        include_stats=args.stats and not args.concat,
+                        status_display=status_display,
+                        pacer=pacer,
+                    )
+                )
+
+        # The group cancels the other workers if one fails (or on Ctrl-C)
+        # instead of leaving them orphaned.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(_produce())
+                for _ in range(n_workers):
+                    tg.create_task(_worker())
+        except BaseExceptionGroup as eg:
+            # The first failure is re-raised for main() to report; any others
+            # would be lost with the group, so they are logged here.
+            first, *others = eg.exceptions
+            for exc in others:
+                logging.error("Also failed: %r", exc, exc_info=exc)
+            raise first from eg
         status_display.update_status("Finished")
         status_display.stop()
     finally:
+        _drain_logs()
         console_handler.setLevel(orig_console_level)
-        for h in logging.getLogger().handlers:
-            if isinstance(h, logging.FileHandler):
-                h.flush()
-    results = pre_results + results
-    results = pre_results + results
-    ok = [r for r in results if r[0] == "ok"] + skipped
-    none = [r for r in results if r[0] == "none"]
-    fail = [r for r in results if r[0] == "fail"]
-    proxy_fail = [r for r in results if r[0] == "proxy_fail"]
+        if file_handler:
+            file_handler.flush()
+    for res in pre_results:
+        buckets.setdefault(res[0], []).append(res)
+    ok = buckets["ok"] + skipped
+    none = buckets["none"]
+    fail = buckets["fail"]
+    proxy_fail = buckets["proxy_fail"]
     if log_file and not ok and not fail and not none and not proxy_fail:
         try:
             log_file.unlink()
         except FileNotFoundError:
             pass
 
+    # The summary's log lines are dropped without -v or --log-file; skip
+    # building their URL lists then.
+    log_summary = logging.getLogger().isEnabledFor(logging.INFO)
+
+    def _emit_group(items, cap: int, log_label: str, con_label: str, colour: str) -> None:
+        """Log a result group as plain URLs and print it with titles.
+
+        Both outputs come from one pass over the first *cap* entries, and
+        the console listing is written in one call.
+        """
+        if not items:
+            return
+        shown = list(itertools.islice(items, cap))
+        urls = list(map("https://youtu.be/{}".format, (vid for _, vid, _ in shown)))
+        lines = [f"{colour}{con_label}:{C.END}\n"]
+        lines.extend(
+            f"{colour}• {url} — {title[:70]}{C.END}\n"
+            for url, (_, _, title) in zip(urls, shown)
+        )
+        if len(items) > cap:
+            lines.append(f"{colour}• ...and {len(items) - cap} more{C.END}\n")
+        sys.stdout.write("".join(lines))
+        if log_summary:
+            logging.info("%s (%d): %s", log_label, len(items), ", ".join(urls))
+
     def _emit_final_summary() -> None:
         total = len(ok) + len(none) + len(fail) + len(proxy_fail)
-        
-        # Log to file (without emojis) - plain text for log parsing
-        if none:
-            none_limited = none[:args.summary_max_no_captions]
-            logging.info(
-                "Videos without captions (%d): %s",
-                len(none),
-                ", ".join(f"https://youtu.be/{vid}" for _, vid, _ in none_limited),
-            )
-        if fail:
-            fail_limited = fail[:args.summary_max_failed]
-            logging.info(
-                "Videos failed (%d): %s",
-                len(fail),
-                ", ".join(f"https://youtu.be/{vid}" for _, vid, _ in fail_limited),
-            )
-        if proxy_fail:
-            proxy_fail_limited = proxy_fail[:args.summary_max_failed]
-            logging.info(
-                "Videos failed due to proxy/network (%d): %s",
-                len(proxy_fail),
-                ", ".join(f"https://youtu.be/{vid}" for _, vid, _ in proxy_fail_limited),
-            )
+
+        # Result groups: plain URLs to the log, titled entries to the console.
+        # The console part is always shown regardless of verbosity level.
+        print()  # Add spacing before summary
+        _emit_group(
+            none, args.summary_max_no_captions,
+            "Videos without captions", "Videos without captions", C.YEL,
+        )
+        _emit_group(
+            fail, args.summary_max_failed,
+            "Videos failed", "Videos transcripts that failed to download", C.RED,
+        )
+        _emit_group(
+            proxy_fail, args.summary_max_failed,
+            "Videos failed due to proxy/network", "Videos failed due to proxy/network", C.RED,
+        )
         logging.info(
             "Summary: ok=%d  no_caption=%d  failed=%d  proxy_failed=%d  banned_proxies=%d  total=%d",
             len(ok),
@@ -774,55 +1074,34 @@ async def _main() -> None:
             len(banned_proxies),
             total,
         )
-        if proxies_used:
-            used_limited = list(sorted(proxies_used))[:args.summary_max_proxies]
+        # Only the first few proxies in sort order are listed; select them
+        # without sorting the whole set.
+        used_limited = heapq.nsmallest(args.summary_max_proxies, proxies_used)
+        if proxies_used and log_summary:
             logging.info(
                 "Proxies used (%d): %s",
                 len(proxies_used),
                 ", ".join(used_limited),
             )
-        if banned_proxies:
-            banned_limited = list(sorted(banned_proxies))[:args.summary_max_proxies]
+        if banned_proxies and log_summary:
+            banned_limited = heapq.nsmallest(args.summary_max_proxies, banned_proxies)
             logging.info(
                 "Banned proxies (%d): %s",
                 len(banned_proxies),
                 ", ".join(banned_limited),
             )
-        
+
         # Print to console (with emojis) - completely separate from logging
-        # Always show final summary regardless of verbosity level
         if True:  # Always show final summary
-            print()  # Add spacing before summary
-            if none:
-                none_limited = none[:args.summary_max_no_captions]
-                print(f"{C.YEL}Videos without captions:{C.END}")
-                for _, vid, title in none_limited:
-                    print(f"{C.YEL}• https://youtu.be/{vid} — {title[:70]}{C.END}")
-                if len(none) > args.summary_max_no_captions:
-                    print(f"{C.YEL}• ...and {len(none) - args.summary_max_no_captions} more{C.END}")
-            if fail:
-                fail_limited = fail[:args.summary_max_failed]
-                print(f"{C.RED}Videos transcripts that failed to download:{C.END}")
-                for _, vid, title in fail_limited:
-                    print(f"{C.RED}• https://youtu.be/{vid} — {title[:70]}{C.END}")
-                if len(fail) > args.summary_max_failed:
-                    print(f"{C.RED}• ...and {len(fail) - args.summary_max_failed} more{C.END}")
-            if proxy_fail:
-                proxy_fail_limited = proxy_fail[:args.summary_max_failed]
-                print(f"{C.RED}Videos failed due to proxy/network:{C.END}")
-                for _, vid, title in proxy_fail_limited:
-                    print(f"{C.RED}• https://youtu.be/{vid} — {title[:70]}{C.END}")
-                if len(proxy_fail) > args.summary_max_failed:
-                    print(f"{C.RED}• ...and {len(proxy_fail) - args.summary_max_failed} more{C.END}")
-            
             if proxies_used:
-                print()  # Add spacer before proxies used section
-                used_limited = list(sorted(proxies_used))[:args.summary_max_proxies]
-                print(f"{C.RED}Proxies Used:{C.END}")
-                for proxy in used_limited:
-                    print(f"{C.RED}• {proxy}{C.END}")
+                # Spacer, header and entries go out in one write.
+                lines = [f"\n{C.RED}Proxies Used:{C.END}\n"]
+                lines.extend(f"{C.RED}• {proxy}{C.END}\n" for proxy in used_limited)
                 if len(proxies_used) > args.summary_max_proxies:
-                    print(f"{C.RED}• ...and {len(proxies_used) - args.summary_max_proxies} more{C.END}")
+                    lines.append(
+                        f"{C.RED}• ...and {len(proxies_used) - args.summary_max_proxies} more{C.END}\n"
+                    )
+                sys.stdout.write("".join(lines))
             
             # Add spacer before summary
             print()
@@ -841,78 +1120,62 @@ async def _main() -> None:
             print(f"📁 Output Directory: {out_dir.resolve()}")
             print()  # Add spacing after summary
 
-    stats_files: list[Path] = []
-    _seen_stats: set[Path] = set()
+    # Insertion-ordered and de-duplicated: files to list in the stats block.
+    stats_files: dict[Path, None] = {}
+    # Stats of files whose final content was measured while writing them.
+    known_stats: dict[Path, tuple[int, int, int]] = {}
     if args.concat and ok:
         logging.info("Per-file stats are disabled during concatenation")
         status_display.update_status("Concatenating output...")
         base_name = args.basename
         concat_paths = []
         if args.format == "json":
-            current_objs: list = []
+            # Each item is kept as its own indented JSON text, re-indented to
+            # sit inside ``"items"``; the part file is assembled from those
+            # instead of dumping the whole payload again.
+            current_items: list[str] = []
             meta_list: list[tuple[str, str]] = []
             w_tot = l_tot = c_tot = 0
             file_idx = 1
 
             def _flush_json():
-                nonlocal current_objs, w_tot, l_tot, c_tot, file_idx, meta_list
+                nonlocal current_items, w_tot, l_tot, c_tot, file_idx, meta_list
                 fname = f"{base_name}_{file_idx:05d}" if split_limit else base_name
                 tgt = out_dir / f"{fname}.json"
-                for it in current_objs:
-                    while True:
-                        txt = json.dumps(it, indent=2, ensure_ascii=False)
-                        if not txt.endswith("\n"):
-                            txt += "\n"
-                        w_i, l_i, c_i = _stats(txt)
-                        wanted = {"words": w_i, "lines": l_i, "chars": c_i}
-                        if it.get("stats") == wanted:
-                            break
-                        it["stats"] = wanted
-                payload = {"items": current_objs}
-                txt = json.dumps(payload, ensure_ascii=False, indent=2)
-                if not txt.endswith("\n"):
-                    txt += "\n"
+                body = '{\n  "items": [\n' + ",\n".join(current_items) + "\n  ]"
                 if args.stats:
-                    while True:
-                        txt = json.dumps(payload, indent=2, ensure_ascii=False)
-                        new = _stats(txt)
-                        if payload.get("stats") == {
-                            "words": new[0],
-                            "lines": new[1],
-                            "chars": new[2],
-                        }:
-                            break
-                        payload["stats"] = {
-                            "words": new[0],
-                            "lines": new[1],
-                            "chars": new[2],
-                        }
+                    txt, new = _splice_stats(f"{body},\n  {_STATS_PLACEHOLDER}\n}}")
+                else:
+                    txt = body + "\n}\n"
+                    new = _stats(txt)
                 tgt.write_text(txt, encoding="utf-8")
+                known_stats[tgt] = new
                 concat_paths.append(tgt)
-                if tgt not in _seen_stats:
-                    _seen_stats.add(tgt)
-                    stats_files.append(tgt)
-                current_objs = []
+                stats_files[tgt] = None
+                current_items = []
                 w_tot = l_tot = c_tot = 0
                 meta_list = []
                 file_idx += 1
 
-            for v_idx, v in enumerate(videos, 1):
-                vid = v["videoId"]
-                for _, v_ok, title in ok:
-                    if v_ok == vid:
-                        break
-                else:
+            # One directory scan and one dict replace a glob and a linear
+            # search of ``ok`` per video.
+            by_vid = _index_by_video_id(out_dir, "json")
+            ok_titles = {vid: title for _, vid, title in reversed(ok)}
+            sources = []
+            for vid, _ in videos:
+                title = ok_titles.get(vid)
+                if title is None:
                     continue
-                try:
-                    pattern = f"*{glob.escape('[' + vid + ']')}*.json"
-                    src = next(out_dir.glob(pattern))
-                except StopIteration:
+                src = by_vid.get(vid)
+                if src is None:
                     logging.warning("File for %s not found - prefix off?", vid)
                     continue
+                sources.append((vid, title, src))
+            read_json = functools.partial(Path.read_text, encoding="utf-8")
+            for (vid, title, src), fut in _read_ahead(sources, read_json):
                 try:
-                    obj_txt = src.read_text(encoding="utf-8")
-                    obj = json.loads(obj_txt)
+                    obj_txt = fut.result()
+                    obj = _loads_json(obj_txt)
                 except Exception as e:
                     logging.warning("Skip corrupted JSON %s (%s)", src.name, e)
                     continue
@@ -922,53 +1185,72 @@ async def _main() -> None:
                     or (split_unit == "l" and l_tot + l_p > split_limit)
                     or (split_unit == "c" and c_tot + c_p > split_limit)
                 )
-                if exceed and current_objs:
+                if exceed and current_items:
                     _flush_json()
-                current_objs.append(obj)
+                item_txt, _ = _json_with_stats(obj)
+                current_items.append("    " + item_txt[:-1].replace("\n", "\n    "))
                 meta_list.append((vid, title))
                 w_tot += w_p
                 l_tot += l_p
                 c_tot += c_p
-            if current_objs:
+            if current_items:
                 _flush_json()
         else:
-            SEP = lambda v, t: f"\n──── {v} ── {t[:50]} ─────────────────────────\n"
             file_idx = 1
             fname = f"{base_name}_{file_idx:05d}" if split_limit else base_name
-            tgt = out_dir / f"{fname}.{EXT[args.format]}"
-            dst = tgt.open("w", encoding="utf-8")
+            tgt = out_dir / f"{fname}.{ext}"
+            dst = tgt.open("wb", buffering=_CONCAT_BUFSIZE)
             concat_paths.append(tgt)
-            if tgt not in _seen_stats:
-                _seen_stats.add(tgt)
-                stats_files.append(tgt)
+            stats_files[tgt] = None
             w_tot = l_tot = c_tot = 0
+            # Separators are not part of the header's counts, but they are in
+            # the file; every piece starts and ends on a newline, so the
+            # whole-file stats are simply the sum of both tallies.
+            sep_w = sep_l = sep_c = 0
             meta_list: list[tuple[str, str]] = []
 
-            def _rollover():
-                nonlocal file_idx, dst, w_tot, l_tot, c_tot, tgt, meta_list
+            def _close_current():
                 dst.close()
+                w, l, c = w_tot, l_tot, c_tot
                 if args.stats:
-                    hdr, _w, _l, _c = _fixup_loop(
+                    hdr, w, l, c = _fixup_loop(
                         (w_tot, l_tot, c_tot), args.format, meta_list
                     )
                     _prepend_header(concat_paths[-1], hdr)
+                known_stats[concat_paths[-1]] = (w + sep_w, l + sep_l, c + sep_c)
+
+            def _rollover():
+                nonlocal file_idx, dst, w_tot, l_tot, c_tot, sep_w, sep_l, sep_c
+                nonlocal tgt, meta_list
+                _close_current()
                 file_idx += 1
                 fname = f"{base_name}_{file_idx:05d}"
-                tgt = out_dir / f"{fname}.{EXT[args.format]}"
+                tgt = out_dir / f"{fname}.{ext}"
                 concat_paths.append(tgt)
-                dst = tgt.open("w", encoding="utf-8")
+                dst = tgt.open("wb", buffering=_CONCAT_BUFSIZE)
                 meta_list = []
                 w_tot = l_tot = c_tot = 0
+                sep_w = sep_l = sep_c = 0
 
-            for v in videos:
-                vid = v["videoId"]
-                title_runs = v.get("title", {}).get("runs", [])
-                title = title_runs[0]["text"] if title_runs else vid
-                pattern = f"*{glob.escape('[' + vid + ']')}*.{EXT[args.format]}"
-                piece_file = next(out_dir.glob(pattern))
-                piece = piece_file.read_text(encoding="utf-8")
-                dst.write(SEP(vid, title))
-                body_w, body_l, body_c = _stats(piece)
+            by_vid = _index_by_video_id(out_dir, ext)
+            pieces = []
+            for vid, title in videos:
+                piece_file = by_vid.get(vid)
+                if piece_file is None:
+                    logging.warning("File for %s not found - prefix off?", vid)
+                    continue
+                pieces.append((vid, title, piece_file))
+            for (vid, title, _), fut in _read_ahead(pieces, Path.read_bytes):
+                piece = fut.result()
+                if b"\r" in piece:  # same newline translation read_text() does
+                    piece = piece.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+                sep = _concat_sep(vid, title)
+                dst.write(sep.encode("utf-8"))
+                s_w, s_l, s_c = _stats(sep)
+                sep_w += s_w
+                sep_l += s_l
+                sep_c += s_c
+                body_w, body_l, body_c = _stats_bytes(piece)
                 pred_w, pred_l, pred_c = w_tot + body_w, l_tot + body_l, c_tot + body_c
                 exceed = split_limit and (
                     (split_unit == "w" and pred_w > split_limit)
@@ -977,67 +1259,67 @@ async def _main() -> None:
                 )
                 if exceed and (w_tot or l_tot or c_tot):
                     _rollover()
-                    pred_meta = [(vid, title)]
-                    if args.stats:
-                        _, pred_w, pred_l, pred_c = _fixup_loop(
-                            (body_w, body_l, body_c), args.format, pred_meta
-                        )
                 dst.write(piece)
                 meta_list.append((vid, title))
                 w_tot += body_w
                 l_tot += body_l
                 c_tot += body_c
-            dst.close()
-            if args.stats:
-                hdr, w_tot, l_tot, c_tot = _fixup_loop(
-                    (w_tot, l_tot, c_tot), args.format, meta_list
-                )
-                _prepend_header(concat_paths[-1], hdr)
+            _close_current()
         if log_file:
             logging.info(
                 "Concatenated output → %s", ", ".join(p.name for p in concat_paths)
             )
-        print(f"\n{C.GRN}✅ Concatenated transcripts saved to:{C.END}")
-        for p in concat_paths:
-            print(f"   📄 {p}")
-        print()
+        sys.stdout.write(
+            f"\n{C.GRN}✅ Concatenated transcripts saved to:{C.END}\n"
+            + "".join(f"   📄 {p}\n" for p in concat_paths)
+            + "\n"
+        )
     if not args.concat:
+        by_vid = _index_by_video_id(out_dir, ext)
         for _, vid, title in ok:
-            try:
-                p = next(out_dir.glob(f"*{vid}*.{EXT[args.format]}"))
-                if p not in _seen_stats:
-                    _seen_stats.add(p)
-                    stats_files.append(p)
-            except StopIteration:
+            p = by_vid.get(vid)
+            if p is None:
                 continue
+            stats_files[p] = None
     if stats_files:
-        ranked = sorted(
-            stats_files,
-            key=lambda p: _stats(p.read_text(encoding="utf-8", errors="ignore"))[2],
-            reverse=True,
-        )
+        # Read and measure every file once, concurrently in worker threads;
+        # the sort and the listing below both reuse the cached tuple.  Files
+        # measured while being written are not read back.
+        async def _known_or_measure(p: Path):
+            if p in known_stats:
+                return known_stats[p]
+            return await asyncio.to_thread(_measure_file, p)
+
+        file_stats = await asyncio.gather(*(_known_or_measure(p) for p in stats_files))
+        measured = [(p, st) for p, st in zip(stats_files, file_stats) if st]
         # Use new flag with fallback to old flag for backward compatibility
         stats_limit = args.summary_stats_top or args.stats_top
-        if stats_limit:
-            ranked = ranked[: stats_limit]
+        by_chars = lambda t: t[1][2]
+        if stats_limit and stats_limit < len(measured):
+            ranked = heapq.nlargest(stats_limit, measured, key=by_chars)
+        else:
+            ranked = sorted(measured, key=by_chars, reverse=True)
         header_txt = "File statistics:"
         if len(ranked) == 1:
             header_txt = "File statistics (top 1):"
         elif stats_limit and stats_limit < len(stats_files):
             header_txt = f"File statistics (top {len(ranked)})"
-        print(f"{C.BLU}📄 {header_txt}{C.END}")
         pad = len(str(len(ranked))) or 1
-        for idx, p in enumerate(ranked, 1):
-            try:
-                txt = p.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                continue
-            w, l, c = _stats(txt)
-            print(
-                f"  {idx:0{pad}d}. {p.name} - {C.GRN}{w:,}{C.END} w · {C.GRN}{l:,}{C.END} l · {C.GRN}{c:,}{C.END} c"
+        grn, end = C.GRN, C.END
+        # Build the line template once; only the values vary per file.
+        line = (
+            f"  {{0:0{pad}d}}. {{1}} - {grn}{{2:,}}{end} w · "
+            f"{grn}{{3:,}}{end} l · {grn}{{4:,}}{end} c\n"
+        ).format
+        sys.stdout.write(
+            f"{C.BLU}📄 {header_txt}{C.END}\n"
+            + "".join(
+                line(idx, p.name, w, l, c)
+                for idx, (p, (w, l, c)) in enumerate(ranked, 1)
             )
-        print()
-    if log_file and console_level <= logging.INFO:
+            + "\n"
+        )
+    if log_file and show_progress:
         print(f"📝 Full log: {C.BLU}{log_file}{C.END}")
     
     try:
@@ -1060,44 +1342,68 @@ async def _main() -> None:
             _emit_final_summary()
         except Exception as e:
             logging.error("Error generating final summary: %s", e)
-        
-        # Flush and shutdown logging
-        try:
-            for h in logging.getLogger().handlers:
-                if hasattr(h, 'flush'):
-                    h.flush()
-            logging.shutdown()
-        except Exception:
-            pass  # Ignore logging cleanup errors
     if fail:
         sys.exit(2)
 
 
 async def main() -> None:
+    loop = asyncio.get_running_loop()
+    interrupted = False
+
+    def _on_sigint() -> None:
+        nonlocal interrupted
+        interrupted = True
+        for task in asyncio.all_tasks(loop):
+            task.cancel()
+
     def _sigint(signum, frame):
         raise KeyboardInterrupt
 
-    signal.signal(signal.SIGINT, _sigint)
+    # Let the loop's wakeup fd deliver Ctrl-C as task cancellation; fall back
+    # to a raising handler where that isn't supported (Windows, non-main thread).
     try:
-        await _main()
-    except KeyboardInterrupt:
-        try:
-            logging.warning("Interrupted by user")
-            print(f"\n{C.BLU}Aborted by user{C.END}")
-        except Exception:
-            pass  # Ignore errors during interrupt handling
-        sys.exit(130)
-    except Exception as e:
-        try:
-            logging.error("Unexpected error: %s", e)
-            print(f"\n{C.RED}Error: {e}{C.END}")
-        except Exception:
-            pass  # Ignore errors during error handling
-        sys.exit(1)
+        loop.add_signal_handler(signal.SIGINT, _on_sigint)
+        loop_handler = True
+    except (NotImplementedError, RuntimeError, ValueError):
+        signal.signal(signal.SIGINT, _sigint)
+        loop_handler = False
+    # Everything a run redirects or starts (stderr tee, log listeners) is
+    # undone in LIFO order when the run ends, however it ends – only after
+    # the handlers below have logged, so their records still get written.
+    try:
+        with contextlib.ExitStack() as stack:
+            try:
+                await _run(stack)
+            except (KeyboardInterrupt, asyncio.CancelledError) as exc:
+                if isinstance(exc, asyncio.CancelledError) and not interrupted:
+                    raise
+                try:
+                    logging.warning("Interrupted by user")
+                    print(f"\n{C.BLU}Aborted by user{C.END}")
+                except Exception:
+                    pass  # Ignore errors during interrupt handling
+                sys.exit(130)
+            except Exception as e:
+                try:
+                    logging.error("Unexpected error: %s", e)
+                    print(f"\n{C.RED}Error: {e}{C.END}")
+                except Exception:
+                    pass  # Ignore errors during error handling
+                sys.exit(1)
+    finally:
+        if loop_handler:
+            loop.remove_signal_handler(signal.SIGINT)
 
 
 def cli_entry():
-    if sys.platform.startswith("linux"):
+    # Redirected output (or an explicit NO_COLOR) gets plain text: blanking
+    # the codes once is cheaper than emitting and later stripping them.
+    if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+        _disable_colours()
+    # ``--help`` exits during argument parsing, before any real event-loop
+    # work, so don't pay for importing uvloop on that path.
+    wants_help = any(a in ("-h", "--help") for a in sys.argv[1:])
+    if sys.platform.startswith("linux") and not wants_help:
         try:
             import uvloop
             uvloop.install()
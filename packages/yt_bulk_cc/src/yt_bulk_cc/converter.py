@@ -5,13 +5,19 @@ private modules.
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Iterable
 
 from .formatters import FMT, EXT
 from .utils import stats, detect, coerce_attr  # re-exported for convenience
+from .utils import dumps_json, loads_json
 
 __all__ = [
     "convert_existing",
@@ -49,13 +55,195 @@ def extract_cues(blob):
     return []
 
 
+# Only long transcripts are worth keying for reuse; shorter ones are
+# formatted faster than their key can be built.
+_REUSE_MIN_CUES = 256
+
+# Spawning a worker costs more than converting a handful of files, so each
+# process is only started once there are this many files for it.
+_POOL_MIN_FILES = 8
+
+
+def _cue_sketch(cue_list) -> tuple | None:
+    """Return a cheap fingerprint of a long *cue_list*, else ``None``.
+
+    Equal transcripts share a sketch, so only cue lists whose sketch repeats
+    need the full comparison.
+    """
+    if len(cue_list) < _REUSE_MIN_CUES:
+        return None
+    first, last = cue_list[0], cue_list[-1]
+    return (
+        len(cue_list),
+        first.get("start"),
+        first.get("text"),
+        last.get("start"),
+        last.get("text"),
+    )
+
+
+def _convert_one(
+    jfile: Path, dest_fmt: str, out_dir: Path, include_stats: bool
+) -> tuple[str | None, str]:
+    """Convert a single JSON file for :func:`convert_existing`.
+
+    Returns ``(output_name, "")``, or ``(None, reason)`` when the file is
+    skipped.  Nothing is logged here: in a pool worker the CLI's log
+    handlers are not available, so the caller reports the outcome.
+    """
+    from .header import _fixup_loop, _prepend_header, _single_file_header
+
+    try:
+        # Parsed straight from bytes; no decoded copy of the file is kept.
+        data = loads_json(jfile.read_bytes())
+    except Exception as exc:  # pragma: no cover – corrupt file
+        return None, f"Skip unreadable JSON {jfile} ({exc})"
+
+    cues = extract_cues(data)
+    if not cues:
+        return None, f"No cues in {jfile}"
+
+    dst = _dst_path(jfile, dest_fmt, out_dir)
+    if dest_fmt == "json":
+        new_txt = dumps_json(data)
+        if not new_txt.endswith("\n"):
+            new_txt += "\n"
+    else:
+        many_srt = dest_fmt == "srt" and "items" in data and len(data["items"]) > 2
+
+        def _format(cue_list) -> str:
+            return FMT[dest_fmt].format_transcript(coerce_attr(cue_list))
+
+        def _render_one(meta: dict, txt: str):
+            if include_stats and not many_srt:
+                txt = _single_file_header(dest_fmt, txt, meta)
+            return txt
+
+        if "items" in data:  # concatenated JSON
+            # Each rendered part goes straight to disk and each parsed
+            # item is released once rendered, so neither the whole body
+            # nor a second copy of it is ever held in memory.  Parts are
+            # newline-joined, which adds one line and one char per join
+            # and never merges words, so the stats are summed per part.
+            items = data.pop("items")
+            items.reverse()
+            del cues, data
+            # Re-uploads make identical transcripts common in channel
+            # dumps; format each repeated long one only once.
+            repeats = {
+                sk
+                for sk, n in Counter(
+                    _cue_sketch(item["transcript"]) for item in items
+                ).items()
+                if n > 1 and sk is not None
+            }
+            formatted: dict[tuple, str] = {}
+            meta_acc = []
+            w = l = c = 0
+            joins = -1
+            # LF throughout, like the CLI's concatenated output: the header
+            # is later prepended as raw bytes with no newline translation.
+            with dst.open("w", encoding="utf-8", newline="\n", buffering=1 << 20) as fh:
+                while items:
+                    item = items.pop()
+                    meta = {k: item[k] for k in ("video_id", "title", "url")}
+                    cue_list = item["transcript"]
+                    if repeats and _cue_sketch(cue_list) in repeats:
+                        key = tuple(
+                            (cue.get("start"), cue.get("duration"), cue.get("text"))
+                            for cue in cue_list
+                        )
+                        txt = formatted.get(key)
+                        if txt is None:
+                            txt = formatted[key] = _format(cue_list)
+                    else:
+                        txt = _format(cue_list)
+                    parts = [_render_one(meta, txt)]
+                    if not many_srt:
+                        parts.insert(0, "──── {video_id} ── {title}\n".format(**meta))
+                    for part in parts:
+                        joins += 1
+                        if joins:
+                            fh.write("\n")
+                        fh.write(part)
+                        p_w, p_l, p_c = stats(part)
+                        w += p_w
+                        l += p_l
+                        c += p_c
+                    meta_acc.append((meta["video_id"], meta["title"]))
+
+            if include_stats and not many_srt:
+                hdr, *_ = _fixup_loop((w, l + joins, c + joins), dest_fmt, meta_acc)
+                _prepend_header(dst, hdr)
+            new_txt = None  # already on disk
+        else:  # single-video JSON
+            meta = {k: data[k] for k in ("video_id", "title", "url")}
+            new_txt = _render_one(meta, _format(cues))
+
+    if new_txt is not None:
+        dst.write_text(new_txt, encoding="utf-8")
+    return dst.name, ""
+
+
+def _cache_file(out_dir: Path) -> Path:
+    """Return the manifest of earlier conversions into *out_dir*.
+
+    It remembers which sources were converted with which options, so
+    re-running over a grown directory only converts what changed.  It lives
+    in the user's cache directory, not among the converted files.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or (
+        os.environ.get("LOCALAPPDATA") if os.name == "nt" else None
+    )
+    root = Path(base) if base else Path.home() / ".cache"
+    digest = hashlib.sha1(str(out_dir.resolve()).encode("utf-8")).hexdigest()
+    return root / "yt_bulk_cc" / f"convert-{digest[:16]}.json"
+
+
+def _dst_path(jfile: Path, dest_fmt: str, out_dir: Path) -> Path:
+    return out_dir / jfile.with_suffix(f".{EXT[dest_fmt]}").name
+
+
+def _load_cache(path: Path) -> dict:
+    try:
+        cache = loads_json(path.read_bytes())
+    except (OSError, ValueError):  # missing or corrupt – start afresh
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _source_sig(jfile: Path, dest_fmt: str, include_stats: bool) -> list:
+    st = jfile.stat()
+    return [st.st_mtime_ns, st.st_size, dest_fmt, include_stats]
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _outcome(jfile: Path, run) -> tuple[str | None, str]:
+    """Return ``run()``, turning a failure into a skip for *jfile* alone."""
+    try:
+        return run()
+    except Exception as exc:
+        return None, f"Cannot convert {jfile} ({exc.__class__.__name__}: {exc})"
+
+
 # ---------------------------------------------------------------------------
 # Public conversion API
 # ---------------------------------------------------------------------------
 
 
 def convert_existing(
-    src: str | Path, dest_fmt: str, out_dir: Path, *, include_stats: bool = True
+    src: str | Path,
+    dest_fmt: str,
+    out_dir: Path,
+    *,
+    include_stats: bool = True,
+    overwrite: bool = False,
 ) -> None:
     """Convert previously downloaded JSON transcript(s) to *dest_fmt*.
 
@@ -69,58 +257,62 @@ def convert_existing(
         Destination directory for converted files (will be created).
     include_stats
         If *True* and the format supports it, prepend a stats header.
-    """
-    from .formatters import FMT, EXT
-    from .header import _fixup_loop, _single_file_header
-    from .utils import stats as _legacy_stats
+    overwrite
+        If *True*, convert every source even if it is up to date.
 
+    Sources converted by an earlier call with the same options, and whose
+    source and output files are both unchanged since, are skipped.
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
-    dest_ext = EXT[dest_fmt]
-
+    cache_file = _cache_file(out_dir)
+    cache = {} if overwrite else _load_cache(cache_file)
+    files = []
+    sigs = {}
     for jfile in iter_json_files(src):
-        try:
-            data = json.loads(jfile.read_text(encoding="utf-8"))
-        except Exception as exc:  # pragma: no cover – corrupt file
-            logging.warning("Skip unreadable JSON %s (%s)", jfile, exc)
-            continue
-
-        cues = extract_cues(data)
-        if not cues:
-            logging.warning("No cues in %s", jfile)
+        key = str(jfile.resolve())
+        sigs[key] = _source_sig(jfile, dest_fmt, include_stats)
+        dst_mtime = _mtime_ns(_dst_path(jfile, dest_fmt, out_dir))
+        if dst_mtime is not None and cache.get(key) == [*sigs[key], dst_mtime]:
+            logging.info("• %s is up to date", jfile.name)
             continue
+        files.append(jfile)
+    workers = min(len(files) // _POOL_MIN_FILES, os.cpu_count() or 1)
+    if workers > 1:
+        # Files are independent and conversion is CPU-bound; spread them
+        # over processes.  Workers are spawned, not forked: the CLI's status
+        # display thread is already running when this is called.
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as ex:
+            pending = [
+                ex.submit(_convert_one, f, dest_fmt, out_dir, include_stats)
+                for f in files
+            ]
+            results = [_outcome(f, fut.result) for f, fut in zip(files, pending)]
+    else:
+        results = [
+            _outcome(f, partial(_convert_one, f, dest_fmt, out_dir, include_stats))
+            for f in files
+        ]
 
-        if dest_fmt == "json":
-            new_txt = json.dumps(data, ensure_ascii=False, indent=2)
-            if not new_txt.endswith("\n"):
-                new_txt += "\n"
+    # Only sources seen in this run are remembered, so entries for deleted
+    # or renamed files do not pile up.
+    cache = {key: cache[key] for key in sigs if key in cache}
+    for jfile, (name, problem) in zip(files, results):
+        key = str(jfile.resolve())
+        if name is None:
+            cache.pop(key, None)
+            logging.warning("%s", problem)
         else:
-            many_srt = dest_fmt == "srt" and "items" in data and len(data["items"]) > 2
-
-            def _render_one(meta: dict, cue_list):
-                txt = FMT[dest_fmt].format_transcript(coerce_attr(cue_list))
-                if include_stats and not many_srt:
-                    txt = _single_file_header(dest_fmt, txt, meta)
-                return txt
-
-            if "items" in data:  # concatenated JSON
-                parts, meta_acc = [], []
-                for item in data["items"]:
-                    meta = {k: item[k] for k in ("video_id", "title", "url")}
-                    if not many_srt:
-                        parts.append("──── {video_id} ── {title}\n".format(**meta))
-                    parts.append(_render_one(meta, item["transcript"]))
-                    meta_acc.append((meta["video_id"], meta["title"]))
-                body = "\n".join(parts)
-
-                if include_stats and not many_srt:
-                    hdr, *_ = _fixup_loop(stats(body), dest_fmt, meta_acc)  # type: ignore[arg-type]
-                    new_txt = hdr + body
-                else:
-                    new_txt = body
-            else:  # single-video JSON
-                meta = {k: data[k] for k in ("video_id", "title", "url")}
-                new_txt = _render_one(meta, cues)
-
-        dst = out_dir / jfile.with_suffix(f".{dest_ext}").name
-        dst.write_text(new_txt, encoding="utf-8")
-        logging.info("✔ converted %s → %s", jfile.name, dst.name)
+            cache[key] = [*sigs[key], _mtime_ns(out_dir / name)]
+            logging.info("✔ converted %s → %s", jfile.name, name)
+    # Written aside and swapped in, so an interrupted run or a concurrent
+    # one never leaves a truncated manifest behind.
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(dumps_json(cache), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError as exc:  # unwritable cache dir – conversion still done
+        tmp.unlink(missing_ok=True)
+        logging.debug("Cannot write %s (%s)", cache_file, exc)
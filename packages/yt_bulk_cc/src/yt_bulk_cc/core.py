@@ -8,15 +8,23 @@ other modules to keep responsibilities clear.
 from __future__ import annotations
 
 import asyncio
-import json
+import collections
+import contextlib
 import logging
+import threading
 from pathlib import Path
 from typing import Sequence
 import requests
 from youtube_transcript_api.proxies import GenericProxyConfig
 from youtube_transcript_api.proxies import WebshareProxyConfig
 from .user_agent import _pick_ua
-from .utils import coerce_attr, detect, make_proxy as _make_proxy, stats as _stats
+from .utils import (
+    coerce_attr,
+    detect,
+    dumps_json as _dumps_json,
+    json_with_stats as _json_with_stats,
+    make_proxy as _make_proxy,
+)
 
 import time
 from youtube_transcript_api import YouTubeTranscriptApi
@@ -39,6 +47,103 @@ __all__ = [
 ]
 
 
+# Keep-alive sessions reused across videos and retries so connections and
+# TLS handshakes are paid once per proxy rather than once per request.
+# ``requests.Session`` is not thread-safe and fetches run on executor
+# threads, so every thread keeps its own pool keyed by proxy label.  Each
+# pool holds at most ``_POOL_SIZE`` sessions; the least recently used one
+# is closed beyond that, which bounds open sockets with rotating proxies.
+_POOL_SIZE = 8
+_pools: dict[int, collections.OrderedDict[str, requests.Session]] = {}
+_pools_lock = threading.Lock()
+
+
+def _prime(session: requests.Session, cookies: list | None) -> requests.Session:
+    session.headers.update({"User-Agent": _pick_ua()})
+    # A pooled session still holds what the server set for the previous UA;
+    # each request should look like a fresh client with only the user's jar.
+    session.cookies.clear()
+    if cookies:
+        for c in cookies:
+            session.cookies.set(c.get("name"), c.get("value"))
+    return session
+
+
+@contextlib.contextmanager
+def _session(proxy, label: str, cookies: list | None):
+    """Yield a session for *label* with a fresh UA and the cookie jar.
+
+    Configs that force ``Connection: close`` (Webshare) have nothing to
+    reuse, so they get a throwaway session that is closed afterwards.
+    """
+    if proxy is not None and proxy.prevent_keeping_connections_alive:
+        session = requests.Session()
+        try:
+            yield _prime(session, cookies)
+        finally:
+            session.close()
+        return
+    tid = threading.get_ident()
+    pool = _pools.get(tid)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools[tid] = collections.OrderedDict()
+    session = pool.pop(label, None)
+    if session is None:
+        session = requests.Session()
+        while len(pool) >= _POOL_SIZE:
+            pool.popitem(last=False)[1].close()
+    pool[label] = session
+    yield _prime(session, cookies)
+
+
+def _close_sessions() -> None:
+    """Close every pooled session; the CLI calls this when a run ends."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        while pool:
+            pool.popitem()[1].close()
+
+
+def _fetch(vid: str, languages: list[str], proxy, label: str, cookies: list | None):
+    """Fetch *vid*'s transcript through the calling thread's session."""
+    with _session(proxy, label, cookies) as session:
+        api = YouTubeTranscriptApi(proxy_config=proxy, http_client=session)
+        return api.fetch(vid, languages=languages)
+
+
+class _TokenBucket:
+    """Pace transcript requests shared by all download workers.
+
+    Tokens refill at *rate* per second up to *capacity*; :meth:`acquire`
+    waits for one, so requests are spread out instead of firing in bursts.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._stamp: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            if self._stamp is not None:
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._stamp) * self._rate
+                )
+            self._stamp = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._tokens = 1.0
+                self._stamp = loop.time()
+            self._tokens -= 1
+
+
 def probe_video(
     vid: str,
     *,
@@ -73,41 +178,37 @@ def probe_video(
         else:
             label = "direct"
 
-        session = requests.Session()
-        session.headers.update({"User-Agent": _pick_ua()})
-        if cookies:
-            for c in cookies:
-                session.cookies.set(c.get("name"), c.get("value"))
-        api = YouTubeTranscriptApi(proxy_config=proxy, http_client=session)
+        with _session(proxy, label, cookies) as session:
+            api = YouTubeTranscriptApi(proxy_config=proxy, http_client=session)
 
-        for attempt in range(1, tries + 1):  # Retry loop
-            logging.info("Probe attempt %d/%d via %s", attempt, tries, label)
-            try:
-                api.fetch(vid, languages=["en"])
-                return True, banned
-            except (TooManyRequests, IpBlocked) as exc:
-                if addr:
-                    banned.add(addr)
-                    logging.info("🚫 banned %s (%s)", label, exc.__class__.__name__)
-                elif label == "direct":
-                    banned.add(label)
-                    logging.info("🚫 banned %s (%s)", label, exc.__class__.__name__)
-                wait = 6 * attempt  # Exponential backoff
-                logging.debug(
-                    "⏳ Probe for %s - retrying in %ss (attempt %s/%s)",
-                    vid,
-                    wait,
-                    attempt,
-                    tries,
-                )
-                time.sleep(wait)  # Use time.sleep for synchronous probe
-                continue
-            except requests.exceptions.RequestException as exc:
-                logging.debug("Probe network error via %s: %s", label, exc)
-                time.sleep(1 * attempt)
-                continue
-            except Exception:
-                return True, banned  # Other errors are not considered IP blocks
+            for attempt in range(1, tries + 1):  # Retry loop
+                logging.info("Probe attempt %d/%d via %s", attempt, tries, label)
+                try:
+                    api.fetch(vid, languages=["en"])
+                    return True, banned
+                except (TooManyRequests, IpBlocked) as exc:
+                    if addr:
+                        banned.add(addr)
+                        logging.info("🚫 banned %s (%s)", label, exc.__class__.__name__)
+                    elif label == "direct":
+                        banned.add(label)
+                        logging.info("🚫 banned %s (%s)", label, exc.__class__.__name__)
+                    wait = 6 * attempt  # Exponential backoff
+                    logging.debug(
+                        "⏳ Probe for %s - retrying in %ss (attempt %s/%s)",
+                        vid,
+                        wait,
+                        attempt,
+                        tries,
+                    )
+                    time.sleep(wait)  # Use time.sleep for synchronous probe
+                    continue
+                except requests.exceptions.RequestException as exc:
+                    logging.debug("Probe network error via %s: %s", label, exc)
+                    time.sleep(1 * attempt)
+                    continue
+                except Exception:
+                    return True, banned  # Other errors are not considered IP blocks
         if addr:
             banned.add(addr)  # If all retries fail, ban the proxy
             logging.info("🚫 banned %s (failed)", label)
@@ -134,6 +235,7 @@ async def grab(
     include_stats: bool = True,
     delay: float = 0.0,
     status_display=None,
+    pacer: _TokenBucket | None = None,
 ) -> tuple[str, str, str]:  # (status, video_id, title)
     async with sem:
         banned = banned if banned is not None else set()
@@ -176,18 +278,17 @@ async def grab(
                 if status_display and hasattr(status_display, 'proxy_start_download'):
                     status_display.proxy_start_download(label or "direct")
 
-                session = requests.Session()
-                session.headers.update({"User-Agent": _pick_ua()})
-                if cookies:
-                    for c in cookies:
-                        session.cookies.set(c.get("name"), c.get("value"))
-
-                api = YouTubeTranscriptApi(proxy_config=proxy, http_client=session)
-
+                if pacer is not None:
+                    await pacer.acquire()
+                # Session lookup and the fetch both happen on the worker
+                # thread that owns the pooled session.
                 tr = await asyncio.to_thread(
-                    api.fetch,
+                    _fetch,
                     vid,
-                    languages=list(langs) if langs else ["en"],
+                    list(langs) if langs else ["en"],
+                    proxy,
+                    label or "direct",
+                    cookies,
                 )
                 fmt_tr = (
                     tr if hasattr(tr, "__iter__") else coerce_attr(tr.to_raw_data())
@@ -208,33 +309,24 @@ async def grab(
                         ),
                     )
 
-                    # embed per-file stats unless we know we'll concatenate later
+                    # embed per-file stats unless we know we'll concatenate
+                    # later; they describe exactly the text written to disk,
+                    # including the final newline that the dump omits.
                     if include_stats:
-                        for _ in range(3):  # converges fast
-                            # Make the measurement on **exactly** the same
-                            # text that will be written to disk - including
-                            # the final newline that json.dumps omits.
-                            tmp = json.dumps(payload, indent=2, ensure_ascii=False)
-                            if not tmp.endswith("\n"):
-                                tmp += "\n"
-                            w, l, c = _stats(tmp)
-                            wanted = {"words": w, "lines": l, "chars": c}
-                            if payload.get("stats") == wanted:
-                                break
-                            payload["stats"] = wanted
-
-                    data = json.dumps(payload, ensure_ascii=False, indent=2)
-                    if not data.endswith("\n"):
-                        data += "\n"
+                        data, _ = _json_with_stats(payload)
+                    else:
+                        data = _dumps_json(payload)
+                        if not data.endswith("\n"):
+                            data += "\n"
                 else:
                     data = FMT[fmt_key].format_transcript(fmt_tr)
 
-                if fmt_key == "json" or not include_stats:
-                    # JSON, or stats explicitly disabled → dump verbatim
-                    path.write_text(data, encoding="utf-8")
-                else:
-                    full = _single_file_header(fmt_key, data, meta)
-                    path.write_text(full, encoding="utf-8")
+                # JSON, or stats explicitly disabled → dump verbatim
+                if fmt_key != "json" and include_stats:
+                    data = _single_file_header(fmt_key, data, meta)
+                # The write runs on a worker thread so file I/O overlaps the
+                # other workers' fetches instead of blocking the loop.
+                await asyncio.to_thread(path.write_text, data, encoding="utf-8")
                 logging.info("✔ saved %s", path.name)
                 
                 # Mark proxy as finished downloading
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import datetime
-import logging
+import os
+import shutil
 from pathlib import Path
 from .utils import stats as _stats
 
@@ -41,18 +42,22 @@ def _fixup_loop(
     fmt: str,
     metas: list[tuple[str, str]] | None,
 ) -> tuple[str, int, int, int]:
-    """Return ``(header_text, W, L, C)`` self-consistently."""
+    """Return ``(header_text, W, L, C)`` self-consistently.
+
+    Each count is a single token on the stats line, so only its digit
+    count feeds back: a header rendered with zeros gives the final words
+    and lines, and the total char count is solved directly.
+    """
     body_w, body_l, body_c = body
-    w, l, c = body
     ts_frozen = datetime.datetime.now().isoformat()
-    for _ in range(10):
-        hdr = _header_text(fmt, w, l, c, metas, _ts_override=ts_frozen)
-        hw, hl, hc = _stats(hdr)
-        w2, l2, c2 = body_w + hw, body_l + hl, body_c + hc
-        if (w, l, c) == (w2, l2, c2):
-            return hdr, w, l, c
-        w, l, c = w2, l2, c2
-    logging.warning("Header stats failed to converge in 10 rounds; using last attempt")
+    hdr0 = _header_text(fmt, 0, 0, 0, metas, _ts_override=ts_frozen)
+    hw, hl, hc0 = _stats(hdr0)
+    w, l = body_w + hw, body_l + hl
+    base = body_c + hc0 - 3 + len(f"{w:,}") + len(f"{l:,}")  # minus the "0"s
+    c = base + 1
+    while base + len(f"{c:,}") != c:
+        c = base + len(f"{c:,}")
+    hdr = _header_text(fmt, w, l, c, metas, _ts_override=ts_frozen)
     return hdr, w, l, c
 
 
@@ -71,10 +76,47 @@ def _single_file_header(fmt: str, body_txt: str, meta: dict[str, str]) -> str:
     return hdr + aux_txt + body_txt
 
 
+def _write_all(dst, data: bytes) -> None:
+    """Write all of *data* to the unbuffered *dst*, resuming short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[dst.write(view):]
+
+
+def _copy_rest(src, dst) -> None:
+    """Copy *src* from its current offset to the end into *dst*.
+
+    Uses ``os.copy_file_range`` where available so the body never passes
+    through userspace; falls back to a chunked read/write copy (other
+    platforms, or filesystems that reject the syscall) from wherever the
+    kernel stopped.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            while copy_range(src.fileno(), dst.fileno(), 1 << 30):
+                pass
+            return
+        except OSError:
+            pass
+    while chunk := src.read(1 << 20):
+        _write_all(dst, chunk)
+
+
 def _prepend_header(path: Path, hdr: str) -> None:
     """Prepend ``hdr`` to the contents of ``path``."""
-    txt = path.read_text(encoding="utf-8", errors="ignore")
-    path.write_text(hdr + txt, encoding="utf-8")
+    tmp = path.with_name(path.name + ".hdr")
+    try:
+        # Unbuffered so the file objects always agree with the fd offsets
+        # that ``copy_file_range`` advances.
+        with path.open("rb", buffering=0) as src, tmp.open("wb", buffering=0) as dst:
+            _write_all(dst, hdr.encode("utf-8"))
+            _copy_rest(src, dst)
+        shutil.copymode(path, tmp)  # keep the original permission bits
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 __all__ = [
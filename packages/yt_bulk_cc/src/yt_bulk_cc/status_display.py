@@ -40,6 +40,10 @@ class StatusDisplay:
         self.progress_task = None
         self._active = False
         self._currently_active_proxies: set[str] = set()  # Track proxies in active use
+        # Updates only mark the panel stale; Live's refresh thread rebuilds it
+        # (at most refresh_per_second times) when it next draws.
+        self._dirty = True
+        self._panel: Optional[Panel] = None
         
     def start(self) -> None:
         """Start the dynamic status display."""
@@ -57,10 +61,10 @@ class StatusDisplay:
             
             # Start live display
             self.live_display = Live(
-                self._generate_display(),
                 console=self.console,
                 refresh_per_second=4,
-                auto_refresh=True
+                auto_refresh=True,
+                get_renderable=self._current_display,
             )
             self.live_display.start()
             self._active = True
@@ -246,11 +250,22 @@ class StatusDisplay:
             logging.debug("Error generating display: %s", e)
             return Panel(f"Status: {self.status_message}")
     
+    def _current_display(self) -> Panel:
+        """Return the panel, rebuilding it only if state changed since last draw."""
+        if self._dirty or self._panel is None:
+            self._dirty = False
+            self._panel = self._generate_display()
+        return self._panel
+
     def _refresh_display(self) -> None:
-        """Refresh the live display."""
+        """Mark the live display stale; it is redrawn on the next refresh tick."""
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Redraw the live display immediately."""
         if self.live_display and self._active:
             try:
-                self.live_display.update(self._generate_display())
+                self.live_display.refresh()
             except Exception as e:
                 logging.debug("Error refreshing display: %s", e)
 
@@ -267,6 +282,9 @@ class FallbackStatusDisplay:
     
     def stop(self) -> None:
         pass
+
+    def flush(self) -> None:
+        pass
     
     def update_status(self, message: str) -> None:
         logging.info("Status: %s", message)
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import json
+import mmap
 import os
 import re
 from pathlib import Path
@@ -15,10 +17,22 @@ from types import SimpleNamespace
 from urllib.parse import urlparse, urlunparse
 from youtube_transcript_api.proxies import GenericProxyConfig, WebshareProxyConfig
 
+try:
+    import orjson
+except ImportError:  # optional – faster JSON serialisation
+    orjson = None
+
 __all__ = [
     "BAD_REGEX",
     "slug",
     "stats",
+    "stats_bytes",
+    "stats_path",
+    "dumps_json",
+    "loads_json",
+    "json_with_stats",
+    "splice_stats",
+    "STATS_PLACEHOLDER",
     "shorten_path",
     "detect",
     "coerce_attr",
@@ -68,21 +82,157 @@ def shorten_path(p: Path) -> Path:  # pragma: no cover – OS-specific
 
 def slug(text: str, max_len: int = 120) -> str:
     """Return a filesystem-safe, reasonably short slice of *text*."""
-    text = BAD_REGEX.sub("_", text).strip()
-    text = re.sub(r"\s+", " ", text)
+    # ``str.split()`` uses the same whitespace set as ``\s`` and runs in C, so
+    # joining the pieces collapses whitespace runs without a second regex.
+    text = " ".join(BAD_REGEX.sub("_", text).split())
     if len(text) > max_len:
         text = text[:max_len].rsplit(" ", 1)[0] + "…"
     return text or "untitled"
 
 
+# Inputs larger than this are counted one newline-aligned slice at a time,
+# so neither the word list nor a file buffer grows with the whole input.
+_STATS_CHUNK = 1 << 22
+
+
 def stats(txt: str) -> tuple[int, int, int]:
     """Return *(words, lines, chars)* exactly like the *nix `wc` tool."""
     chars = len(txt)
-    words = len(re.findall(r"\S+", txt))
     lines = txt.count("\n")  # match `wc -l` semantics
+    # ``str.split()`` splits on exactly the ``\s`` set and runs in C; long
+    # texts are split per slice to keep the temporary word list small.
+    if chars <= _STATS_CHUNK:
+        return len(txt.split()), lines, chars
+    words = 0
+    start = 0
+    while start < chars:
+        end = txt.find("\n", start + _STATS_CHUNK - 1)
+        end = chars if end < 0 else end + 1
+        words += len(txt[start:end].split())
+        start = end
+    return words, lines, chars
+
+
+# Whitespace that ``\s`` matches in ``str`` patterns but ``bytes.split()``
+# does not: the ASCII separators 0x1C-0x1F plus every multi-byte Unicode
+# space, spelled as UTF-8 sequences.
+_UNICODE_WS_BYTES = re.compile(
+    rb"[\x1c-\x1f]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]"
+    rb"|\xe2\x81\x9f|\xe3\x80\x80"
+)
+_UTF8_CONTINUATION = bytes(range(0x80, 0xC0))
+
+
+def stats_bytes(buf: bytes) -> tuple[int, int, int]:
+    """Return :func:`stats` of UTF-8 *buf* without decoding it to ``str``.
+
+    Newlines are counted as ``read_text()`` would translate them: ``\\r\\n``
+    is one char and a lone ``\\r`` is a line break.
+    """
+    lines = buf.count(b"\n")
+    if buf.isascii():
+        chars = len(buf)
+    else:
+        # one code point per non-continuation byte
+        chars = len(buf.translate(None, _UTF8_CONTINUATION))
+    if b"\r" in buf:
+        crlf = buf.count(b"\r\n")
+        lines += buf.count(b"\r") - crlf
+        chars -= crlf
+    # ``\r`` is whitespace to ``split()`` either way, so words are unaffected.
+    words = len(_UNICODE_WS_BYTES.sub(b" ", buf).split())
     return words, lines, chars
 
 
+def stats_path(path: str | os.PathLike[str]) -> tuple[int, int, int]:
+    """Return :func:`stats` for the UTF-8 file at *path*.
+
+    Files over ``_STATS_CHUNK`` bytes are read through a mapping instead of
+    one large buffer.
+    """
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size <= _STATS_CHUNK:
+            return stats_bytes(fh.read())
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):  # POSIX only
+                buf.madvise(mmap.MADV_SEQUENTIAL)
+            size = len(buf)
+            words = lines = chars = 0
+            start = 0
+            while start < size:
+                # Cutting just after a newline never splits a word, a
+                # UTF-8 sequence (0x0A only ever encodes U+000A) or a
+                # ``\r\n`` pair.
+                end = buf.find(b"\n", start + _STATS_CHUNK - 1)
+                end = size if end < 0 else end + 1
+                w, l, c = stats_bytes(buf[start:end])
+                words += w
+                lines += l
+                chars += c
+                start = end
+            return words, lines, chars
+
+
+def dumps_json(obj) -> str:
+    """Return *obj* as 2-space indented JSON with non-ASCII kept verbatim.
+
+    Uses ``orjson`` when installed; its layout matches the stdlib one apart
+    from float exponents (``1e16`` rather than ``1e+16``).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def loads_json(data: bytes | str):
+    """Parse JSON *data*, with ``orjson`` when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# How :func:`dumps_json` lays out a top-level ``"stats"`` entry.
+def _stats_block(w: int, l: int, c: int) -> str:
+    return dumps_json({"stats": {"words": w, "lines": l, "chars": c}})[4:-2]
+
+
+STATS_PLACEHOLDER = _stats_block(0, 0, 0)
+
+
+def splice_stats(txt: str) -> tuple[str, tuple[int, int, int]]:
+    """Replace the top-level :data:`STATS_PLACEHOLDER` in JSON *txt*.
+
+    The block is filled with the :func:`stats` of the resulting text.  The
+    counters are single tokens on fixed lines, so only their digit count
+    feeds back into the result: the placeholder text already has the exact
+    words and lines, and chars is solved without re-serialising.
+    """
+    w, l, c0 = stats(txt)
+    base = c0 - 3 + len(str(w)) + len(str(l))  # the three "0"s are replaced
+    c = base + 1
+    while base + len(str(c)) != c:
+        c = base + len(str(c))
+    head, _, tail = txt.rpartition(STATS_PLACEHOLDER)
+    return head + _stats_block(w, l, c) + tail, (w, l, c)
+
+
+def json_with_stats(
+    obj: dict, *, final_newline: bool = True
+) -> tuple[str, tuple[int, int, int]]:
+    """Set ``obj["stats"]`` to the :func:`stats` of obj's own JSON text.
+
+    Returns the :func:`dumps_json` text and its stats, from a single dump.
+    """
+    obj["stats"] = {"words": 0, "lines": 0, "chars": 0}
+    txt = dumps_json(obj)
+    if final_newline and not txt.endswith("\n"):
+        txt += "\n"
+    txt, (w, l, c) = splice_stats(txt)
+    obj["stats"] = {"words": w, "lines": l, "chars": c}
+    return txt, (w, l, c)
+
+
 # ---------------------------------------------------------------------------
 # Cue adapter (dict → SimpleNamespace)
 # ---------------------------------------------------------------------------
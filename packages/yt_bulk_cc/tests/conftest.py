@@ -22,6 +22,12 @@ def restore_sys_argv(monkeypatch):
     sys.argv[:] = original
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(monkeypatch, tmp_path_factory):
+    """Keep the --convert manifest out of the real user cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture
 def fake_cues():
     return [
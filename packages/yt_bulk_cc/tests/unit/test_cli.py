@@ -1,5 +1,6 @@
 import asyncio
 import json
+import logging
 import re
 import sys
 from pathlib import Path
@@ -30,6 +31,18 @@ def test_download_single_format(tmp_path: Path, fmt):
     assert len(files) == 3, f"expected 3 {fmt} files, got {files}"
 
 
+@pytest.mark.usefixtures("patch_transcript", "patch_scrapetube", "patch_detect")
+def test_overwrite_redownloads_existing(tmp_path: Path):
+    """Existing files are skipped unless --overwrite is given."""
+    run_cli(tmp_path, "dummy", "-f", "text", "-n", "1")
+    (f,) = tmp_path.glob("*.txt")
+    f.write_text("stale", encoding="utf-8")
+    run_cli(tmp_path, "dummy", "-f", "text", "-n", "1")
+    assert f.read_text(encoding="utf-8") == "stale"
+    run_cli(tmp_path, "dummy", "-f", "text", "-n", "1", "--overwrite")
+    assert "Hello" in f.read_text(encoding="utf-8")
+
+
 @pytest.mark.usefixtures("patch_transcript", "patch_scrapetube", "patch_detect")
 @pytest.mark.parametrize("unit", ["w", "c", "l"])
 def test_concat_with_split(tmp_path: Path, unit):
@@ -208,6 +221,25 @@ def test_no_caption_flow(monkeypatch, tmp_path):
     assert len(files) == 1 and files[0].suffix == ".log"
 
 
+@pytest.mark.usefixtures("patch_scrapetube", "patch_detect")
+def test_text_concat_skips_video_without_file(monkeypatch, tmp_path, fake_cues):
+    """A no-caption video in the middle must not abort text concatenation."""
+
+    class _PartialApi:
+        def __init__(self, *a, **kw):
+            pass
+
+        def fetch(self, video_id, *_, **__):
+            if video_id == "vid1":
+                raise ytb.NoTranscriptFound(video_id)
+            return SimpleNamespace(to_raw_data=lambda: fake_cues)
+
+    monkeypatch.setattr(ytb.core, "YouTubeTranscriptApi", _PartialApi)
+    run_cli(tmp_path, "dummy", "-f", "text", "-C", "--basename", "all", "-n", "3")
+    body = (tmp_path / "all.txt").read_text(encoding="utf-8")
+    assert "vid0" in body and "vid2" in body and "vid1" not in body
+
+
 # ────────────────────────── header-stats sanity  ─────────────────────── #
 @pytest.mark.usefixtures("patch_transcript", "patch_scrapetube", "patch_detect")
 @pytest.mark.parametrize("fmt", ["srt", "webvtt", "text", "pretty"])
@@ -415,3 +447,192 @@ def test_concat_order(tmp_path: Path, monkeypatch):
     data = (tmp_path / "combined.txt").read_text()
     found = [line.split()[1] for line in data.splitlines() if line.startswith("──── ")]
     assert found == vids
+
+
+@pytest.mark.usefixtures("patch_transcript")
+def test_limit_stops_listing_early(tmp_path: Path, monkeypatch):
+    """--limit stops pulling from the video listing once N entries are read."""
+    pulled: list[str] = []
+
+    def _endless(*_a, **_k):
+        i = 0
+        while True:
+            vid = f"v{i}"
+            pulled.append(vid)
+            yield {"videoId": vid, "title": {"runs": [{"text": vid}]}}
+            i += 1
+
+    monkeypatch.setattr(ytb, "detect", lambda _u: ("playlist", "demo"))
+    monkeypatch.setattr(ytb, "video_iter", _endless)
+    sys.argv[:] = [
+        "yt_bulk_cc.py",
+        "demo",
+        "-o",
+        str(tmp_path),
+        "-f",
+        "text",
+        "-n",
+        "3",
+    ]
+    ytb.asyncio.run(ytb.main())
+
+    assert pulled == ["v0", "v1", "v2"]
+    assert len(list(tmp_path.glob("*.txt"))) == 3
+
+
+@pytest.mark.usefixtures("patch_transcript", "patch_detect")
+def test_total_grows_while_listing(tmp_path: Path, monkeypatch):
+    """The download total is updated per listed video, not after the crawl."""
+    from yt_bulk_cc import status_display
+
+    events: list[str] = []
+
+    def _listing(*_a, **_k):
+        for i in range(3):
+            events.append(f"listed v{i}")
+            yield {"videoId": f"v{i}", "title": {"runs": [{"text": f"v{i}"}]}}
+
+    def _update(self, count, total=None):
+        if total is not None:
+            events.append(f"total {total}")
+
+    monkeypatch.setattr(ytb, "video_iter", _listing)
+    for cls in (status_display.StatusDisplay, status_display.FallbackStatusDisplay):
+        monkeypatch.setattr(cls, "update_downloads", _update)
+    run_cli(tmp_path, "dummy", "-f", "text")
+    assert events.index("total 1") < events.index("listed v2")
+    assert events[-1] == "total 3"
+
+
+@pytest.mark.usefixtures("patch_detect")
+def test_unexpected_error_reaches_log_file(tmp_path: Path, monkeypatch):
+    """Records logged once the run has failed must still be written."""
+
+    def _boom(*_a, **_k):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(ytb, "video_iter", _boom)
+    # basicConfig is a no-op while pytest's capture handlers sit on root.
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    log_file = tmp_path / "run.log"
+    with pytest.raises(SystemExit) as exc:
+        run_cli(tmp_path, "dummy", "-f", "text", "-L", str(log_file))
+    assert exc.value.code == 1
+    assert "Unexpected error: boom" in log_file.read_text(encoding="utf-8")
+
+
+@pytest.mark.usefixtures("patch_scrapetube", "patch_detect")
+def test_every_worker_failure_is_logged(tmp_path: Path, monkeypatch):
+    """When several workers fail together, none of the errors is dropped."""
+
+    arrived: list[str] = []
+    both = asyncio.Event()
+
+    async def _fail(vid, *_a, **_k):
+        # Hold the first worker until the second one arrives, so both fail
+        # before the task group gets to cancel either.
+        arrived.append(vid)
+        if len(arrived) == 2:
+            both.set()
+        await both.wait()
+        raise RuntimeError(f"fail {vid}")
+
+    monkeypatch.setattr(ytb, "grab", _fail)
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    log_file = tmp_path / "run.log"
+    with pytest.raises(SystemExit):
+        run_cli(tmp_path, "dummy", "-f", "text", "-j", "2", "-L", str(log_file))
+    log = log_file.read_text(encoding="utf-8")
+    assert "Unexpected error: fail" in log
+    assert "Also failed: RuntimeError('fail" in log
+
+
+# ───────────────────────── cookie jar loading ─────────────────────────── #
+@pytest.mark.parametrize("with_orjson", [True, False])
+@pytest.mark.usefixtures("patch_scrapetube", "patch_detect")
+def test_cookie_json_passed_to_grab(tmp_path: Path, monkeypatch, with_orjson):
+    """Cookies parsed from --cookie-json must reach every grab() call."""
+    if not with_orjson:
+        monkeypatch.setattr(ytb.utils, "orjson", None)
+    jar = [{"name": "SID", "value": "abc"}]
+    cookie_file = tmp_path / "cookies.json"
+    cookie_file.write_text(json.dumps(jar), encoding="utf-8")
+
+    seen: list[Any] = []
+
+    async def _fake_grab(*_a, **kw):
+        seen.append(kw.get("cookies"))
+        return ("ok", "x", "t")
+
+    monkeypatch.setattr(ytb, "grab", _fake_grab)
+    run_cli(tmp_path, "dummy", "-f", "text", "-n", "2", "--cookie-json", str(cookie_file))
+    assert seen and all(c == jar for c in seen)
+
+
+@pytest.mark.usefixtures("patch_scrapetube", "patch_detect")
+def test_cookie_json_unreadable_exits(tmp_path: Path):
+    with pytest.raises(SystemExit):
+        run_cli(tmp_path, "dummy", "-n", "1", "--cookie-json", str(tmp_path / "nope.json"))
+
+
+def test_index_by_video_id(tmp_path: Path):
+    """IDs come from the bracketed token, so ``vid1`` never matches ``vid10``."""
+    for name in ("00001 [vid1] One.txt", "00002 [vid10] Ten.txt", "[solo] S.txt", "[vid1] x.srt"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    index = ytb.cli._index_by_video_id(tmp_path, "txt")
+    assert {k: p.name for k, p in index.items()} == {
+        "vid1": "00001 [vid1] One.txt",
+        "vid10": "00002 [vid10] Ten.txt",
+        "solo": "[solo] S.txt",
+    }
+
+
+def test_disable_colours(monkeypatch):
+    for name in ("GRN", "BLU", "RED", "YEL", "END"):
+        monkeypatch.setattr(ytb.cli.C, name, getattr(ytb.cli.C, name))
+    monkeypatch.setattr(ytb.cli.ColorFormatter, "COLORS", ytb.cli.ColorFormatter.COLORS)
+    ytb.cli._disable_colours()
+    rec = logging.LogRecord("x", logging.WARNING, __file__, 1, "boom", (), None)
+    assert "\033[" not in ytb.cli.ColorFormatter("%(levelname)s %(message)s").format(rec)
+
+
+def test_token_bucket_spreads_requests():
+    """After the initial burst, requests are spaced at the bucket's rate."""
+    from yt_bulk_cc.core import _TokenBucket
+
+    async def _run() -> list[float]:
+        bucket = _TokenBucket(rate=50.0, capacity=2)
+        loop = asyncio.get_running_loop()
+        stamps = []
+        for _ in range(6):
+            await bucket.acquire()
+            stamps.append(loop.time())
+        return stamps
+
+    stamps = asyncio.run(_run())
+    assert stamps[1] - stamps[0] < 0.01  # burst of `capacity`
+    assert stamps[-1] - stamps[0] >= 4 / 50 - 0.005
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX signal delivery")
+@pytest.mark.usefixtures("patch_scrapetube", "patch_detect")
+def test_sigint_cancels_run(monkeypatch, tmp_path: Path):
+    import os
+    import signal
+
+    async def _slow_grab(*_a, **_kw):
+        os.kill(os.getpid(), signal.SIGINT)
+        await asyncio.sleep(30)
+        return ("ok", "x", "t")
+
+    monkeypatch.setattr(ytb, "grab", _slow_grab)
+    with pytest.raises(SystemExit) as exc:
+        run_cli(tmp_path, "dummy", "-n", "1")
+    assert exc.value.code == 130
+
+
+def test_color_formatter_leaves_record_untouched():
+    rec = logging.LogRecord("x", logging.WARNING, __file__, 1, "n=%d", (3,), None)
+    out = ytb.cli.ColorFormatter("%(levelname)s %(message)s").format(rec)
+    assert "n=3" in out
+    assert (rec.levelname, rec.msg, rec.args) == ("WARNING", "n=%d", (3,))
@@ -1,5 +1,6 @@
 import asyncio
 import re
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -173,6 +174,74 @@ def test_default_user_agent(monkeypatch, tmp_path: Path):
     assert captured["ua"] == "UA/123"
 
 
+def test_sessions_pooled_per_thread_and_proxy(monkeypatch):
+    """Retries and later videos reuse one keep-alive session per proxy."""
+    seen: list[tuple[str, Any]] = []
+
+    class _FakeApi:
+        def __init__(self, *_, **kw):
+            self.session = kw["http_client"]
+
+        def fetch(self, vid, **_kw):
+            seen.append((vid, self.session))
+            self.session.cookies.set("VISITOR_INFO1_LIVE", vid)
+            return []
+
+    monkeypatch.setattr(ytb.core, "YouTubeTranscriptApi", _FakeApi)
+    monkeypatch.setattr(ytb.core, "_pools", {})
+    cookies = [{"name": "SID", "value": "abc"}]
+    for vid, label in [("a", "direct"), ("b", "direct"), ("c", "http://p:1")]:
+        ytb.core._fetch(vid, ["en"], None, label, cookies)
+    other: list = []
+
+    def _in_thread():
+        with ytb.core._session(None, "direct", None) as session:
+            other.append(session)
+
+    t = threading.Thread(target=_in_thread)
+    t.start()
+    t.join()
+
+    (_, s_a), (_, s_b), (_, s_c) = seen
+    assert s_a is s_b
+    assert s_c is not s_a
+    assert other[0] is not s_a
+    assert s_a.cookies.get("SID") == "abc"
+    # the server cookie set while fetching "a" did not carry over to "b"
+    assert s_a.cookies.get("VISITOR_INFO1_LIVE") == "b"
+
+
+def test_session_pool_is_bounded_and_closed(monkeypatch):
+    """Old sessions are closed past the cap; the rest when the run ends."""
+    closed: list[str] = []
+
+    class _Session:
+        def __init__(self):
+            self.headers: dict = {}
+            self.cookies = SimpleNamespace(set=lambda *_a: None, clear=lambda: None)
+            self.label = ""
+
+        def close(self):
+            closed.append(self.label)
+
+    monkeypatch.setattr(ytb.core.requests, "Session", _Session)
+    monkeypatch.setattr(ytb.core, "_pools", {})
+    monkeypatch.setattr(ytb.core, "_POOL_SIZE", 2)
+    for label in ["p1", "p2", "p1", "p3"]:
+        with ytb.core._session(None, label, None) as session:
+            session.label = label
+    assert closed == ["p2"]  # p1 was used more recently
+
+    webshare = WebshareProxyConfig("user", "pass")
+    with ytb.core._session(webshare, "webshare", None) as session:
+        session.label = "webshare"
+    assert closed == ["p2", "webshare"]  # Connection: close → never pooled
+
+    ytb.core._close_sessions()
+    assert sorted(closed) == ["p1", "p2", "p3", "webshare"]
+    assert ytb.core._pools == {}
+
+
 def test_generic_proxy_flags(monkeypatch, tmp_path: Path):
     """CLI should pass GenericProxyConfig with provided proxy URLs."""
 
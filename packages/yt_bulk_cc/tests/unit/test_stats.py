@@ -125,3 +125,22 @@ def test_stats_header_singular_plural(tmp_path: Path, capsys):
         if "File statistics" in l
     )
     assert hdr_line.strip() == "📄 File statistics (top 1):", "header wording incorrect"
+
+
+# ---------------------------------------------------------------------------
+# S-05  (concat stats listing matches the files actually written)
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("fmt", ["text", "srt", "json"])
+@pytest.mark.parametrize("stats_flag", ["--stats", "--no-stats"])
+@pytest.mark.usefixtures("patch_transcript", "patch_scrapetube", "patch_detect")
+def test_concat_stats_listing_matches_files(tmp_path: Path, capsys, fmt, stats_flag):
+    run_cli(
+        tmp_path, "dummy", "-f", fmt, "-C", "--basename", "combo",
+        "--split", "400c", "-n", "4", stats_flag,
+    )
+    lines = stats_lines(strip_ansi(capsys.readouterr().out))
+    assert lines
+    for line in lines:
+        name = re.search(r"\d+\. (.+?) - ", line).group(1)
+        counts = [int(n.replace(",", "")) for n in re.findall(r"([\d,]+) [wlc]\b", line)]
+        assert tuple(counts) == ytb._stats((tmp_path / name).read_text(encoding="utf-8"))
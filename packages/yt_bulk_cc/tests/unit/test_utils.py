@@ -1,5 +1,6 @@
 from pathlib import Path
 import json
+import os
 import re
 
 import pytest
@@ -12,6 +13,10 @@ def test_slug_strips_bad_chars():
     assert ytb.slug("A/B<C>D|E?F", 20) == "A_B_C_D_E_F"
 
 
+def test_slug_collapses_whitespace():
+    assert ytb.slug("  Intro \t to\u00a0\u00a0 //Python  ") == "Intro to _Python"
+
+
 def test_stats_helper():
     txt = "one two\nthree"
     w, l, c = ytb._stats(txt)
@@ -21,3 +26,278 @@ def test_stats_helper():
 def test_stats_no_final_newline():
     txt = "hello world"
     assert ytb._stats(txt) == (2, 0, 11)
+
+
+@pytest.mark.parametrize(
+    "txt",
+    [
+        "",
+        "plain ascii\nline",
+        "# stats: 1 words · 2 lines\n",
+        "a\u00a0b\u3000c\x1fd",
+        "漢字 😀\n",
+        "hello world\r\nsecond line\r\n",
+        "old mac\rlines\r",
+        "mixed\r\n漢字\rend\n",
+    ],
+)
+def test_stats_bytes_matches_stats(tmp_path: Path, txt: str):
+    from yt_bulk_cc.utils import stats_bytes, stats_path
+
+    f = tmp_path / "t.txt"
+    f.write_bytes(txt.encode("utf-8"))
+    # what read_text() would have returned
+    expected = ytb._stats(f.read_text(encoding="utf-8"))
+    assert stats_bytes(txt.encode("utf-8")) == expected
+    assert stats_path(f) == expected
+
+
+def test_stats_chunked_matches_stats(tmp_path: Path, monkeypatch):
+    from yt_bulk_cc import utils
+
+    txt = "漢字 word\u3000next\n" * 50 + "no newline tail " * 40
+    f = tmp_path / "big.txt"
+    f.write_bytes(txt.encode("utf-8"))
+    expected = ytb._stats(txt)
+    crlf = tmp_path / "big_crlf.txt"
+    crlf.write_bytes(txt.replace("\n", "\r\n").encode("utf-8"))
+    monkeypatch.setattr(utils, "_STATS_CHUNK", 64)
+    assert utils.stats_path(f) == expected
+    assert utils.stats_path(crlf) == expected
+    assert utils.stats(txt) == expected
+
+
+@pytest.mark.parametrize("n", [0, 1, 7, 60, 400])
+@pytest.mark.parametrize("final_newline", [True, False])
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_json_with_stats_is_self_consistent(
+    n: int, final_newline: bool, with_orjson: bool, monkeypatch
+):
+    from yt_bulk_cc import utils
+    from yt_bulk_cc.utils import json_with_stats
+
+    if not with_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+
+    obj = {"stats": {"words": 5}, "title": "漢字 demo", "items": ["a b"] * n}
+    txt, st = json_with_stats(obj, final_newline=final_newline)
+    expected = json.dumps(obj, indent=2, ensure_ascii=False)
+    if final_newline:
+        expected += "\n"
+    assert txt == expected
+    assert st == ytb._stats(txt)
+    assert obj["stats"] == dict(zip(("words", "lines", "chars"), st))
+    assert next(iter(obj)) == "stats"  # existing key keeps its position
+
+
+@pytest.mark.parametrize("body_c", [0, 850, 899, 905, 999_880, 999_999])
+@pytest.mark.parametrize("metas", [None, [("vid1", "A title"), ("vid2", "漢字")]])
+def test_fixup_loop_counts_include_header(body_c: int, metas):
+    body = (7, 3, body_c)
+    hdr, w, l, c = ytb._fixup_loop(body, "text", metas)
+    hw, hl, hc = ytb._stats(hdr)
+    assert (w, l, c) == (body[0] + hw, body[1] + hl, body[2] + hc)
+    assert f"{w:,} words · {l:,} lines · {c:,} chars" in hdr
+
+
+def test_prepend_header_keeps_body(tmp_path: Path):
+    f = tmp_path / "c.txt"
+    body = "漢字 body\n" * 5000
+    f.write_text(body, encoding="utf-8")
+    ytb._prepend_header(f, "# hdr\n\n")
+    assert f.read_text(encoding="utf-8") == "# hdr\n\n" + body
+    assert [p.name for p in tmp_path.iterdir()] == ["c.txt"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_prepend_header_keeps_mode(tmp_path: Path):
+    f = tmp_path / "c.txt"
+    f.write_text("body\n", encoding="utf-8")
+    f.chmod(0o640)
+    ytb._prepend_header(f, "# hdr\n")
+    assert f.stat().st_mode & 0o777 == 0o640
+
+
+def test_prepend_header_without_copy_file_range(tmp_path: Path, monkeypatch):
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    f = tmp_path / "c.txt"
+    body = "漢字 body\n" * 5000
+    f.write_text(body, encoding="utf-8")
+    ytb._prepend_header(f, "# hdr\n\n")
+    assert f.read_text(encoding="utf-8") == "# hdr\n\n" + body
+
+
+def test_prepend_header_resumes_short_writes():
+    from yt_bulk_cc import header
+
+    class _Short:
+        def __init__(self):
+            self.data = b""
+
+        def write(self, b):
+            self.data += bytes(b[:3])
+            return min(3, len(b))
+
+    dst = _Short()
+    header._write_all(dst, "# stats: 漢字\n".encode("utf-8"))
+    assert dst.data.decode("utf-8") == "# stats: 漢字\n"
+
+
+@pytest.mark.parametrize("fmt", ["text", "webvtt"])
+def test_convert_concatenated_json_header_matches_file(tmp_path: Path, fmt: str):
+    items = [
+        {
+            "video_id": f"v{i}",
+            "title": f"Title {i} ünï",
+            "url": f"https://youtu.be/v{i}",
+            "transcript": [
+                {"text": f"hello world {i} {j}", "start": j * 1.5, "duration": 1.25}
+                for j in range(4)
+            ],
+        }
+        for i in range(3)
+    ]
+    src = tmp_path / "all.json"
+    src.write_text(json.dumps({"items": items}), encoding="utf-8")
+    ytb.convert_existing(src, fmt, tmp_path / "out")
+    out = next((tmp_path / "out").iterdir()).read_text(encoding="utf-8")
+    assert extract_header_counts(out) == ytb._stats(out)
+    assert all(f"──── v{i} ──" in out for i in range(3))
+
+
+def test_convert_formats_repeated_transcripts_once(tmp_path: Path, monkeypatch):
+    long_tr = [{"text": f"w {j}", "start": float(j), "duration": 1.0} for j in range(300)]
+    edited = [dict(c) for c in long_tr]
+    edited[150]["text"] = "changed"
+    items = [
+        {"video_id": f"v{i}", "title": "t", "url": "u", "transcript": tr}
+        for i, tr in enumerate([long_tr, edited, long_tr, long_tr])
+    ]
+    src = tmp_path / "all.json"
+    src.write_text(json.dumps({"items": items}), encoding="utf-8")
+    fmt = ytb.FMT["text"]
+    calls = []
+    real = fmt.format_transcript
+    monkeypatch.setattr(fmt, "format_transcript", lambda cues: calls.append(1) or real(cues))
+    ytb.convert_existing(src, "text", tmp_path / "out")
+    out = next((tmp_path / "out").iterdir()).read_text(encoding="utf-8")
+    assert len(calls) == 2
+    assert out.count("w 150") == 3 and out.count("changed") == 1
+
+
+def _write_sources(src: Path, n: int) -> None:
+    """Write *n* one-cue JSON transcripts ``v0.json`` … into *src*."""
+    for i in range(n):
+        blob = {
+            "video_id": f"v{i}",
+            "title": f"T{i}",
+            "url": f"https://youtu.be/v{i}",
+            "transcript": [{"text": f"cue {i}", "start": 0.0, "duration": 1.0}],
+        }
+        (src / f"v{i}.json").write_text(json.dumps(blob), encoding="utf-8")
+
+
+@pytest.mark.parametrize("cpus", [1, 4])
+def test_convert_directory_reports_every_file(tmp_path: Path, caplog, monkeypatch, cpus):
+    # 4 CPUs sends the files through the process pool even on a 1-CPU runner.
+    monkeypatch.setattr(ytb.converter.os, "cpu_count", lambda: cpus)
+    monkeypatch.setattr(ytb.converter, "_POOL_MIN_FILES", 1)
+    src = tmp_path / "src"
+    src.mkdir()
+    _write_sources(src, 4)
+    (src / "empty.json").write_text(json.dumps({"transcript": []}), encoding="utf-8")
+    # fails inside _convert_one (no "title"); the other files still convert
+    (src / "broken.json").write_text(
+        json.dumps({"video_id": "x", "url": "u", "transcript": [{"text": "t"}]}),
+        encoding="utf-8",
+    )
+    with caplog.at_level("INFO"):
+        ytb.convert_existing(src, "text", tmp_path / "out")
+    out = tmp_path / "out"
+    assert sorted(p.name for p in out.iterdir()) == [f"v{i}.txt" for i in range(4)]
+    assert "cue 2" in (out / "v2.txt").read_text(encoding="utf-8")
+    assert sum("✔ converted" in r.message for r in caplog.records) == 4
+    assert any("No cues in" in r.message for r in caplog.records)
+    assert any(
+        "Cannot convert" in r.message and "broken.json" in r.message
+        for r in caplog.records
+    )
+
+
+def test_convert_small_directory_stays_serial(tmp_path: Path, monkeypatch):
+    from yt_bulk_cc import converter
+
+    def _no_pool(*_a, **_k):
+        raise AssertionError("process pool started for a small directory")
+
+    monkeypatch.setattr(converter.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(converter, "ProcessPoolExecutor", _no_pool)
+    src = tmp_path / "src"
+    src.mkdir()
+    _write_sources(src, converter._POOL_MIN_FILES * 2 - 1)
+    ytb.convert_existing(src, "text", tmp_path / "out")
+    assert len(list((tmp_path / "out").iterdir())) == converter._POOL_MIN_FILES * 2 - 1
+
+
+def test_convert_skips_unchanged_sources(tmp_path: Path, caplog):
+    src = tmp_path / "src"
+    src.mkdir()
+    _write_sources(src, 2)
+    out = tmp_path / "out"
+
+    def converted(**kw) -> list[str]:
+        caplog.clear()
+        with caplog.at_level("INFO"):
+            ytb.convert_existing(src, "text", out, **kw)
+        return sorted(
+            r.args[0] for r in caplog.records if r.msg.startswith("✔ converted")
+        )
+
+    assert converted() == ["v0.json", "v1.json"]
+    assert converted() == []
+    v1 = src / "v1.json"
+    v1.write_text(v1.read_text(encoding="utf-8").replace("cue 1", "cue one"), encoding="utf-8")
+    assert converted() == ["v1.json"]
+    assert "cue one" in (out / "v1.txt").read_text(encoding="utf-8")
+    (out / "v0.txt").unlink()
+    assert converted() == ["v0.json"]
+    assert converted(include_stats=False) == ["v0.json", "v1.json"]
+    assert converted(include_stats=False, overwrite=True) == ["v0.json", "v1.json"]
+    assert sorted(p.name for p in out.iterdir()) == ["v0.txt", "v1.txt"]
+
+
+def test_convert_manifest_forgets_removed_sources(tmp_path: Path):
+    from yt_bulk_cc import converter
+
+    src = tmp_path / "src"
+    src.mkdir()
+    _write_sources(src, 2)
+    out = tmp_path / "out"
+    ytb.convert_existing(src, "text", out)
+    manifest = converter._cache_file(out)
+    assert len(json.loads(manifest.read_text(encoding="utf-8"))) == 2
+    (src / "v1.json").unlink()
+    ytb.convert_existing(src, "text", out)
+    assert list(json.loads(manifest.read_text(encoding="utf-8"))) == [
+        str((src / "v0.json").resolve())
+    ]
+
+
+def test_convert_manifest_write_is_atomic(tmp_path: Path, monkeypatch):
+    from yt_bulk_cc import converter
+
+    src = tmp_path / "src"
+    src.mkdir()
+    _write_sources(src, 2)
+    out = tmp_path / "out"
+    ytb.convert_existing(src, "text", out)
+    manifest = converter._cache_file(out)
+    before = manifest.read_bytes()
+
+    def _fail(*_a):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(converter.os, "replace", _fail)
+    ytb.convert_existing(src, "text", out, overwrite=True)
+    assert manifest.read_bytes() == before
+    assert [p.name for p in manifest.parent.iterdir()] == [manifest.name]